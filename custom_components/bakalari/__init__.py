@@ -19,7 +19,10 @@ from .children import ChildrenIndex
 from .const import DOMAIN, MANUFACTURER, MODEL, PLATFORMS, SW_VERSION
 from .coordinator_marks import BakalariMarksCoordinator
 from .coordinator_messages import BakalariMessagesCoordinator
-from .coordinator_noticeboard import BakalariNoticeboardCoordinator
+from .coordinator_noticeboard import (
+    BakalariNoticeboardCoordinator,
+    noticeboard_seen_store,
+)
 from .coordinator_timetable import BakalariTimetableCoordinator
 from .utils import device_ident
 
@@ -222,10 +225,14 @@ def _register_websocket(hass: HomeAssistant, entry: ConfigEntry) -> None:
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up of Bakalari component."""
 
-    children: ChildrenIndex = ChildrenIndex.from_entry(entry)
+    # Child records are schema-validated; keep that off the event loop
+    children: ChildrenIndex = await hass.async_add_executor_job(
+        ChildrenIndex.from_entry, entry
+    )
 
     # create shared library for each child
     _clients: dict[str, BakalariClient] = {}
+    opt_keys = children.opt_keys
     for child in children.children:
         _LOGGER.debug(
             "[class=%s module=%s] Creating client for child: %s",
@@ -234,9 +241,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             child.display_name,
         )
 
-        _client = BakalariClient(
-            hass, entry, children.option_key_for_child(child.key) or ""
-        )
+        _client = BakalariClient(hass, entry, opt_keys[child.key])
         _clients[child.key] = _client
 
     coord_marks = BakalariMarksCoordinator(hass, entry, children, _clients)
@@ -288,3 +293,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
     return ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove data persisted for a config entry."""
+    await noticeboard_seen_store(hass, entry.entry_id).async_remove()
@@ -34,7 +34,10 @@ from .const import (
 from .utils import ensure_child_record, redact_child_info, school_year_bounds
 
 _LOGGER = logging.getLogger(__name__)
-_fetch_lock: asyncio.Lock = asyncio.Lock()
+# Module-global: caps concurrent requests to Bakalari servers across all
+# children of all config entries together (not per entry)
+MAX_PARALLEL_FETCHES = 4
+_fetch_slots: asyncio.Semaphore = asyncio.Semaphore(MAX_PARALLEL_FETCHES)
 _entry_update_lock: asyncio.Lock = asyncio.Lock()
 
 _reauth_state_lock: asyncio.Lock = asyncio.Lock()
@@ -62,6 +65,8 @@ class BakalariClient:
         self.child_id: str = child_id
         self.lib: Bakalari | None = None
         self._lib_lock = asyncio.Lock()
+        # Serializes API calls of this child (tokens are single-use on refresh)
+        self._fetch_lock = asyncio.Lock()
         self._save_lock = asyncio.Lock()
         self._last_tokens: tuple[str, str] | None = None
 
@@ -162,7 +167,7 @@ class BakalariClient:
                 await self._save_tokens_if_changed()
 
         if use_lock:
-            async with _fetch_lock:
+            async with self._fetch_lock, _fetch_slots:
                 return await _execute()
         return await _execute()
 
@@ -36,10 +36,8 @@ async def async_setup_entry(
     data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
     coord: BakalariTimetableCoordinator = data["timetable"]
     children_index: ChildrenIndex = data["children"]
-    child_list: list[Child] = list(children_index.children)
-
     entities: list[BakalariTimetableCalendar] = [
-        BakalariTimetableCalendar(coord, child) for child in child_list
+        BakalariTimetableCalendar(coord, child) for child in children_index.children
     ]
 
     async_add_entities(entities)
@@ -146,21 +144,23 @@ class BakalariTimetableCalendar(BakalariEntity, CalendarEntity):
             events: list[CalendarEvent] = []
             for w in weeks:
                 events.extend(_convert_week_to_events(w))
-            # Deduplicate by (start,end,summary,location)
-            dedup: dict[tuple[str, str, str, str], CalendarEvent] = {}
+            # Deduplicate by (start,end,summary,location); the UTC start is
+            # kept alongside each event so the sort does not recompute it.
+            dedup: dict[tuple[str, str, str, str], tuple[datetime, CalendarEvent]] = {}
             for ev in events:
+                start_utc = _ensure_utc(ev.start)
                 k = (
-                    _ensure_utc(ev.start).isoformat(),
+                    start_utc.isoformat(),
                     _ensure_utc(ev.end).isoformat() if ev.end else "",
                     ev.summary or "",
                     ev.location or "",
                 )
                 # Keep earliest version if duplicates appear
                 if k not in dedup:
-                    dedup[k] = ev
-            final_events = list(dedup.values())
-            final_events.sort(key=lambda e: _ensure_utc(e.start))
-            self._events_cache = final_events
+                    dedup[k] = (start_utc, ev)
+            keyed = list(dedup.values())
+            keyed.sort(key=lambda p: p[0])
+            self._events_cache = [ev for _, ev in keyed]
             self._last_source_version = (
                 version if version is not None else _weeks_version_marker(weeks)
             )
@@ -176,9 +176,10 @@ class BakalariTimetableCalendar(BakalariEntity, CalendarEntity):
     def _compute_next_event(self) -> None:
         """Compute the next upcoming event from cache."""
         now = dt_util.utcnow()
-        upcoming = [ev for ev in self._events_cache if _ensure_utc(ev.start) >= now]
-        upcoming.sort(key=lambda e: _ensure_utc(e.start))
-        self._next_event = upcoming[0] if upcoming else None
+        # Cache is already sorted by start, so the first match is the next one
+        self._next_event = next(
+            (ev for ev in self._events_cache if _ensure_utc(ev.start) >= now), None
+        )
 
     # ------------- Data extraction helpers -------------
 
@@ -238,14 +239,14 @@ def _atom_to_event(
             return None
         start, end = times
         subj, teach, room, groups = _safe_resolve_entities(week, atom)
-        summary = _label_subject(subj) or "Hodina"
+        summary = _label(subj) or "Hodina"
         description = _build_description(
             teach=teach,
             groups=groups,
             theme=getattr(atom, "theme", None),
             change=getattr(atom, "change", None),
         )
-        location = _label_room(room)
+        location = _label(room)
         return CalendarEvent(
             start=start,
             end=end or start,
@@ -314,7 +315,7 @@ def _build_description(
 ) -> str | None:
     """Compose description string from resolved entities."""
     parts: list[str] = []
-    teach_label = _label_teacher(teach)
+    teach_label = _label(teach)
     if teach_label:
         parts.append(f"Učitel: {teach_label}")
     groups_label = _label_groups(groups)
@@ -344,30 +345,16 @@ def _combine_local_utc(d: date, hhmm: str) -> datetime | None:
         return None
 
 
-def _label_subject(subj: Any) -> str | None:
-    if subj is None:
-        return None
-    return getattr(subj, "abbrev", None) or getattr(subj, "name", None)
-
-
-def _label_teacher(teach: Any) -> str | None:
-    if teach is None:
-        return None
-    return getattr(teach, "abbrev", None) or getattr(teach, "name", None)
-
-
-def _label_room(room: Any) -> str | None:
-    if room is None:
+def _label(obj: Any) -> str | None:
+    """Return abbrev or name of a subject, teacher, room or group."""
+    if obj is None:
         return None
-    return getattr(room, "abbrev", None) or getattr(room, "name", None)
+    return getattr(obj, "abbrev", None) or getattr(obj, "name", None)
 
 
 def _label_groups(groups: Any) -> str | None:
     try:
-        items = [
-            getattr(g, "abbrev", None) or getattr(g, "name", None) or ""
-            for g in (groups or [])
-        ]
+        items = [_label(g) or "" for g in (groups or [])]
         items = [i for i in items if i]
         return ",".join(items) if items else None
     except Exception:
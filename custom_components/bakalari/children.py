@@ -1,19 +1,14 @@
 """Children class for Bakalari."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 import logging
+from typing import Any
 
 from .const import (
-    CONF_ACCESS_TOKEN,
     CONF_CHILDREN,
-    CONF_NAME,
-    CONF_REFRESH_TOKEN,
-    CONF_SCHOOL,
     CONF_SERVER,
-    CONF_SURNAME,
     CONF_USER_ID,
-    CONF_USERNAME,
-    ChildRecord,
     ChildrenMap,
 )
 from .utils import ensure_children_dict, make_child_key
@@ -38,16 +33,32 @@ class ChildrenIndex:
     def __init__(self, children_map: ChildrenMap):
         """Initialize the ChildrenIndex."""
         self.children_map = children_map
-        self._by_key: dict[str, ChildRecord] = {}
         self._optkey_by_childkey: dict[str, str] = {}
-        self._list: list[Child] = []
+        self._list: tuple[Child, ...] = ()
+        self._child_by_key: dict[str, Child] = {}
+        self._source: Any = None
 
     @classmethod
     def from_entry(cls, entry) -> "ChildrenIndex":
-        """Create a ChildrenIndex from a dictionary entry."""
-        raw: ChildrenMap = ensure_children_dict(entry.options.get(CONF_CHILDREN, {}))
+        """Create a ChildrenIndex from a dictionary entry.
+
+        Validates every child record; in async context run it in the executor.
+        """
+        raw, opt_map, lst = cls._build_children(entry.options)
+        inst = cls(raw)
+        inst._optkey_by_childkey = opt_map
+        inst._list = tuple(lst)
+        inst._child_by_key = {ch.key: ch for ch in lst}
+        inst._source = entry.options.get(CONF_CHILDREN)
+        return inst
+
+    @staticmethod
+    def _build_children(
+        options: Mapping[str, Any],
+    ) -> tuple[ChildrenMap, dict[str, str], list[Child]]:
+        """Normalize children options into (raw map, option keys, children)."""
+        raw: ChildrenMap = ensure_children_dict(options.get(CONF_CHILDREN, {}))
 
-        by_key: dict[str, ChildRecord] = {}
         opt_map: dict[str, str] = {}
         lst: list[Child] = []
 
@@ -57,7 +68,7 @@ class ChildrenIndex:
             if not server or not user_id:
                 _LOGGER.warning(
                     "[class=%s module=%s] Skipping child with missing server/user_id: %s",
-                    __class__.__name__,
+                    ChildrenIndex.__name__,
                     __name__,
                     cr,
                 )
@@ -65,24 +76,6 @@ class ChildrenIndex:
             ck = make_child_key(server, user_id)
             opt_map[ck] = str(opt_key)
 
-            tmp: ChildRecord = {
-                "user_id": user_id,
-                "username": str(cr.get(CONF_USERNAME, "") or ""),
-                "name": str(cr.get(CONF_NAME, "") or ""),
-                "surname": str(cr.get(CONF_SURNAME, "") or ""),
-                "school": str(cr.get(CONF_SCHOOL)),
-                "server": server,
-            }
-
-            at = cr.get(CONF_ACCESS_TOKEN)
-            rt = cr.get(CONF_REFRESH_TOKEN)
-
-            if at:
-                tmp[CONF_ACCESS_TOKEN] = at
-            if rt:
-                tmp[CONF_REFRESH_TOKEN] = rt
-
-            by_key[ck] = tmp
             display = f"{cr.get('name', '')} {cr.get('surname', '')} ({cr.get('school', '')})".strip()
             lst.append(
                 Child(
@@ -93,16 +86,21 @@ class ChildrenIndex:
                     short_name=str(cr.get("name") or "").strip() or user_id,
                 )
             )
-        inst = cls(raw)
-        inst._by_key = by_key
-        inst._optkey_by_childkey = opt_map
-        inst._list = lst
-        return inst
+        return raw, opt_map, lst
+
+    @property
+    def children(self) -> tuple[Child, ...]:
+        """Returns children (built once in from_entry, shared and immutable)."""
+        return self._list
+
+    def built_from(self, children_options: Any) -> bool:
+        """Return True if the index was built from this children options object."""
+        return self._source is not None and children_options is self._source
 
     @property
-    def children(self) -> list[Child]:
-        """Returns a list of children."""
-        return list(self._list)
+    def opt_keys(self) -> Mapping[str, str]:
+        """Return option keys by child key (built once in from_entry, read-only)."""
+        return self._optkey_by_childkey
 
     def option_key_for_child(self, child_key: str) -> str | None:
         """Return the option key for a child."""
@@ -110,7 +108,4 @@ class ChildrenIndex:
 
     def child_by_key(self, key: str) -> Child:
         """Return a child by its key."""
-        for ch in self._list:
-            if ch.key == key:
-                return ch
-        raise KeyError(key)
+        return self._child_by_key[key]
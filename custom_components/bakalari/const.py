@@ -1,6 +1,8 @@
 """Constants for the Bakalari integration."""
 
-from typing import Final, NotRequired, Required, TypedDict
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Final, NotRequired, Required, TypedDict
 
 DOMAIN = "bakalari"
 
@@ -11,6 +13,10 @@ MODEL = "Bakaláři backend"
 LIB_VERSION: Final = "1.6.2"
 API_VERSION: Final = "0.10.0"
 SW_VERSION: Final = f"API: {API_VERSION} Library: {LIB_VERSION}"
+
+# Shared read-only stand-in for missing coordinator data
+EMPTY_DATA: Final[Mapping[str, Any]] = MappingProxyType({})
+
 CONF_CHILDREN: Final = "children"
 CONF_CREDENTIALS: Final = "credentials"
 CONF_USER_ID: Final = "user_id"
@@ -25,6 +31,8 @@ CONF_SCAN_INTERVAL: Final = "scan_interval"
 CONF_SCHOOL_YEAR_START_DAY: Final = 1
 CONF_SCHOOL_YEAR_START_MONTH: Final = 9
 DEFAULT_SCAN_INTERVAL: Final = 900
+# Also fire the legacy per-message noticeboard event (on by default)
+CONF_NOTICEBOARD_PER_MESSAGE_EVENTS: Final = "noticeboard_per_message_events"
 
 
 class ChildRecord(TypedDict, total=False):
@@ -43,4 +51,5 @@ class ChildRecord(TypedDict, total=False):
 ChildrenMap = dict[str, ChildRecord]
 
 SCHOOLS_CACHE_FILE: Final = "schools_cache.json"
+NOTICEBOARD_SEEN_STORE: Final = "noticeboard_seen"
 RATE_LIMIT_EXCEEDED: Final = "If the server returns a `Connection error`, you may have exceeded the request limit. Try again later or increase the polling interval."
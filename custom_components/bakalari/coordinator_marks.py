@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from datetime import date, datetime, timedelta
 import logging
-from random import random
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -22,7 +22,7 @@ from .const import (
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
 )
-from .utils import school_year_bounds
+from .utils import jittered_seconds, mark_subject_key, school_year_bounds
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,15 +41,17 @@ class BakalariMarksCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.hass = hass
         self.entry = entry
         self.children_index: ChildrenIndex = children_index
-        self.child_list = list(self.children_index.children)
+        self.child_list = self.children_index.children
         self._clients: dict[str, BakalariClient] = clients
 
-        # Diff cache per child: set of (child_key, mark_id)
-        self._seen: set[tuple[str, str]] = set()
+        # Diff cache per child: child_key -> mark ids of the last snapshot
+        self._seen: dict[str, set[str]] = {}
+        # School year bounds cached for the day they were computed on
+        self._sy_cache: tuple[date, date, date] | None = None
 
         # Update interval with jitter (avoid stampedes)
         base = int(entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
-        jittered = int(base * (0.9 + 0.2 * random()))
+        jittered = jittered_seconds(base, f"{entry.entry_id}:marks")
         update_interval = timedelta(seconds=jittered)
 
         super().__init__(
@@ -57,6 +59,8 @@ class BakalariMarksCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             logger=_LOGGER,
             name=f"{DOMAIN} coordinator ({entry.entry_id})",
             update_interval=update_interval,
+            # Skip listener fan-out when the fetched snapshot did not change
+            always_update=False,
         )
 
         _LOGGER.debug(
@@ -70,7 +74,7 @@ class BakalariMarksCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def get_client(self, child_key: str) -> BakalariClient | None:
         """Return a client for a given child."""
 
-        client = self._clients[child_key] or None
+        client = self._clients.get(child_key)
         if not client:
             _LOGGER.error(
                 "[class=%s module=%s] Failed to get client for child %s",
@@ -88,7 +92,7 @@ class BakalariMarksCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Mark a specific mark_id as seen for a given child."""
         ck = child_key or (self.child_list[0].key if self.child_list else "")
         if ck and mark_id:
-            self._seen.add((ck, mark_id))
+            self._seen.setdefault(ck, set()).add(mark_id)
 
     def select_marks(self, child_key: str | None, limit: int) -> list[dict[str, Any]]:
         """Return last N marks for a child (already parsed/flattened)."""
@@ -96,18 +100,16 @@ class BakalariMarksCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         items: list[dict[str, Any]] = (self.data or {}).get("marks_by_child", {}).get(
             ck, []
         ) or []
-        return items[: max(0, limit or 0)]
+        limit = max(0, limit or 0)
+        # Slice (copy) only when it actually drops items; callers must not mutate
+        return items[:limit] if limit < len(items) else items
 
     # ---------- Update lifecycle ----------
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch and prepare marks for all children."""
         try:
-            start_year, end_year = school_year_bounds(
-                dt.now().date(),
-                CONF_SCHOOL_YEAR_START_MONTH,
-                CONF_SCHOOL_YEAR_START_DAY,
-            )
+            start_year, end_year = self._school_year_bounds(dt.now().date())
 
             subjects_by_child: dict[str, dict[str, dict[str, Any]]] = {}
             marks_flat_by_child: dict[str, list[dict[str, Any]]] = {}
@@ -119,30 +121,41 @@ class BakalariMarksCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
                 snap = raw.get("snapshot") or {}
                 subjects_by_child[ch.key] = snap.get("subjects", {})
-                marks_flat_by_child[ch.key] = snap.get("marks_flat", [])
+                marks_flat_by_child[ch.key] = snap.get("marks_flat") or []
                 summary[ch.key] = raw.get("summary", {})
 
         except Exception as err:  # noqa: BLE001
             raise UpdateFailed(str(err)) from err
         else:
-            # Compute is_new per mark (before firing events)
-            annotated_marks_by_child: dict[str, list[dict[str, Any]]] = {}
+            # Compute is_new and the subject key per mark (before firing events)
+            # and group marks by subject. Snapshot items are freshly built per
+            # poll, so they are annotated in place.
+            marks_by_child_subject: dict[str, dict[str, list[dict[str, Any]]]] = {}
+            new_count_by_child: dict[str, int] = {}
             for ck, items in marks_flat_by_child.items():
-                annotated: list[dict[str, Any]] = []
-                for it in items or []:
-                    mark_id = str(it.get("id") or "").strip()
-                    is_new = bool(mark_id) and ((ck, mark_id) not in self._seen)
-                    annotated.append({**it, "is_new": is_new})
-                annotated_marks_by_child[ck] = annotated
+                seen_contains = (self._seen.get(ck) or set()).__contains__
+                by_subject: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+                new_count = 0
+                for it in items:
+                    mark_id = (it.get("id") or "").strip()
+                    is_new = it["is_new"] = bool(mark_id) and not seen_contains(mark_id)
+                    new_count += is_new
+                    skey = it["subject_key"] = mark_subject_key(it)
+                    by_subject[skey].append(it)
+                marks_by_child_subject[ck] = dict(by_subject)
+                new_count_by_child[ck] = new_count
 
             # Diff → fire events for new marks
-            self._fire_new_events(marks_flat_by_child)
+            self._fire_new_events(marks_flat_by_child, new_count_by_child)
 
             return {
                 "subjects_by_child": subjects_by_child,
-                # Backward-compatible flat marks list expected by existing sensors
-                "marks_by_child": annotated_marks_by_child,
+                # Backward-compatible alias of the (annotated) flat marks list
+                "marks_by_child": marks_flat_by_child,
                 "marks_flat_by_child": marks_flat_by_child,
+                # Flat marks grouped by subject key (same dicts, newest first)
+                "marks_by_child_subject": marks_by_child_subject,
+                "new_count_by_child": new_count_by_child,
                 "school_year": {
                     "start": start_year.isoformat(),
                     "end_exclusive": end_year.isoformat(),
@@ -151,6 +164,17 @@ class BakalariMarksCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 "summary": summary,
             }
 
+    def _school_year_bounds(self, today: date) -> tuple[date, date]:
+        """Return school year bounds, recomputed only when the day changes."""
+        cache = self._sy_cache
+        if cache is not None and cache[0] == today:
+            return cache[1], cache[2]
+        start, end = school_year_bounds(
+            today, CONF_SCHOOL_YEAR_START_MONTH, CONF_SCHOOL_YEAR_START_DAY
+        )
+        self._sy_cache = (today, start, end)
+        return start, end
+
     async def _fetch_child(
         self, child: Child, date_from: datetime | date, date_to: datetime | date
     ) -> dict[str, Any]:
@@ -204,19 +228,45 @@ class BakalariMarksCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     # ---------- Event helpers ----------
 
     @callback
-    def _fire_new_events(self, marks_by_child: dict[str, list[dict[str, Any]]]) -> None:
+    def _fire_new_events(
+        self,
+        marks_by_child: dict[str, list[dict[str, Any]]],
+        new_count_by_child: dict[str, int],
+    ) -> None:
         """Emit HA events for newly observed marks."""
         if not marks_by_child:
             return
 
-        bus = self.hass.bus
+        fire = self.hass.bus.async_fire
         for ck, items in marks_by_child.items():
+            seen = self._seen.get(ck)
+            # No unseen mark ids in this snapshot (the usual steady state); the
+            # snapshot ids are then a subset of the seen ids, so only forget
+            # marks that left it
+            if not new_count_by_child.get(ck) and seen is not None:
+                current = {
+                    mark_id
+                    for it in items or []
+                    if (mark_id := (it.get("id") or "").strip())
+                }
+                if current and len(current) != len(seen):
+                    self._seen[ck] = current
+                continue
+
+            seen_contains = (seen or set()).__contains__
+            current: set[str] = set()
+            current_add = current.add
             for it in items or []:
-                mark_id = str(it.get("id") or "").strip()
+                mark_id = (it.get("id") or "").strip()
                 if not mark_id:
                     continue
-                key = (ck, mark_id)
-                if key in self._seen:
+                current_add(mark_id)
+                if seen_contains(mark_id):
                     continue
-                self._seen.add(key)
-                bus.async_fire("bakalari_new_mark", {**it})
+                # Items are freshly parsed per poll and never mutated afterwards
+                fire("bakalari_new_mark", it)
+
+            # Remember only marks of the current snapshot; an empty snapshot is
+            # what the client returns on errors, so keep the previous ids then.
+            if current:
+                self._seen[ck] = current
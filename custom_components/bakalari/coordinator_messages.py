@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 import logging
-from random import random
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -18,6 +18,12 @@ from .const import (
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
 )
+from .utils import (
+    composed_message_id,
+    extract_message_id,
+    jittered_seconds,
+    messages_to_dicts,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -47,6 +53,8 @@ class BakalariMessagesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Diff cache: remember seen messages per (child_key, message_id)
         self._seen_msgs: set[tuple[str, str]] = set()
+        # Id key that matched last time (same for every message of a server)
+        self._msg_id_key: str | None = None
 
         # Interval with jitter so we don't stampede servers
         base = int(
@@ -55,7 +63,7 @@ class BakalariMessagesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             or DEFAULT_SCAN_INTERVAL
         )
-        jittered = int(base * (0.9 + 0.2 * random()))
+        jittered = jittered_seconds(base, f"{entry.entry_id}:messages")
         update_interval = timedelta(seconds=jittered)
 
         super().__init__(
@@ -63,6 +71,8 @@ class BakalariMessagesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             logger=_LOGGER,
             name=f"{DOMAIN} messages coordinator ({entry.entry_id})",
             update_interval=update_interval,
+            # Skip listener fan-out when the fetched snapshot did not change
+            always_update=False,
         )
 
         _LOGGER.debug(
@@ -79,7 +89,7 @@ class BakalariMessagesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def get_client(self, child_key: str) -> BakalariClient | None:
         """Return a client for a given child."""
 
-        client = self._clients[child_key] or None
+        client = self._clients.get(child_key)
         if not client:
             _LOGGER.error(
                 "[class=%s module=%s] Failed to get client for child %s",
@@ -99,7 +109,8 @@ class BakalariMessagesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         items: list[dict[str, Any]] = (self.data or {}).get(
             "messages_by_child", {}
         ).get(child_key, []) or []
-        if limit is not None and limit >= 0:
+        # Slice (copy) only when it actually drops items; callers must not mutate
+        if limit is not None and 0 <= limit < len(items):
             return items[:limit]
         return items
 
@@ -120,19 +131,22 @@ class BakalariMessagesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         try:
             messages_by_child: dict[str, list[dict[str, Any]]] = {}
 
-            for child in self.children_index.children:
-                parsed = await self._fetch_child_messages(child.key)
-                # annotate new/seen
-                annotated: list[dict[str, Any]] = []
+            children = self.children_index.children
+            # Fetch all children concurrently (bounded by the client)
+            results = await asyncio.gather(
+                *(self._fetch_child_messages(child.key) for child in children)
+            )
+            for child, parsed in zip(children, results, strict=True):
+                # annotate new/seen in place (parsed dicts are freshly built)
                 for m in parsed:
                     mid = self._extract_message_id(m)
                     is_new = bool(mid) and ((child.key, mid) not in self._seen_msgs)
+                    m["is_new"] = is_new
                     if is_new and mid:
                         # Remember and fire an event
                         self._seen_msgs.add((child.key, mid))
                         self._fire_new_message_event(child.key, m)
-                    annotated.append({**m, "is_new": is_new})
-                messages_by_child[child.key] = annotated
+                messages_by_child[child.key] = parsed
         except Exception as err:  # noqa: BLE001
             raise UpdateFailed(str(err)) from err
         else:
@@ -150,8 +164,8 @@ class BakalariMessagesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         raw_items = await client.async_get_messages()
         parsed: list[dict[str, Any]] = []
         try:
-            parsed = [orjson.loads(m.as_json()) for m in (raw_items or [])]
-        except Exception:  # noqa: BLE001
+            parsed = messages_to_dicts(raw_items)
+        except (AttributeError, TypeError, orjson.JSONDecodeError):
             _LOGGER.exception(
                 "[class=%s module=%s] Failed to parse messages for child_key=%s",
                 self.__class__.__name__,
@@ -162,21 +176,14 @@ class BakalariMessagesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     # -------- Helpers --------
 
-    @staticmethod
-    def _extract_message_id(msg: dict[str, Any]) -> str | None:
+    def _extract_message_id(self, msg: dict[str, Any]) -> str | None:
         """Try to extract some stable identifier from the message."""
-        for key in ("id", "message_id", "uuid", "guid", "Id", "MessageId"):
-            v = msg.get(key)
-            if v is None:
-                continue
-            s = str(v).strip()
-            if s:
-                return s
+        found = extract_message_id(msg, self._msg_id_key)
+        if found is not None:
+            mid, self._msg_id_key = found
+            return mid
         # Fallback: compose from typical fields, may be unstable but better than nothing
-        composed = "-".join(
-            str(msg.get(k, "")).strip() for k in ("subject", "title", "date", "created")
-        ).strip("-")
-        return composed or None
+        return composed_message_id(msg)
 
     @callback
     def _fire_new_message_event(self, child_key: str, msg: dict[str, Any]) -> None:
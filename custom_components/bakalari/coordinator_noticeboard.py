@@ -2,21 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import defaultdict
 from datetime import timedelta
 import logging
-from random import random
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 import orjson
 
 from .api import BakalariClient
 from .children import ChildrenIndex
 from .const import (
+    CONF_NOTICEBOARD_PER_MESSAGE_EVENTS,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    NOTICEBOARD_SEEN_STORE,
+)
+from .utils import (
+    composed_message_id,
+    extract_message_id,
+    jittered_seconds,
+    messages_to_dicts,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -24,6 +34,15 @@ _LOGGER = logging.getLogger(__name__)
 # Optional options key for messages polling. If not provided, falls back to DEFAULT_SCAN_INTERVAL.
 CONF_SCAN_INTERVAL_NOTICEBOARD = "scan_interval_noticeboard"
 NOTICEBOARD_DEFAULT_SCAN_INTERVAL = 1800  # 1 hour default for messages
+# Delay (s) to coalesce writes of the seen messages store
+SEEN_SAVE_DELAY = 10
+
+
+def noticeboard_seen_store(
+    hass: HomeAssistant, entry_id: str
+) -> Store[dict[str, list[str]]]:
+    """Return the store persisting seen noticeboard message ids of an entry."""
+    return Store(hass, 1, f"{DOMAIN}.{NOTICEBOARD_SEEN_STORE}.{entry_id}")
 
 
 class BakalariNoticeboardCoordinator(DataUpdateCoordinator[dict[str, Any]]):
@@ -45,8 +64,15 @@ class BakalariNoticeboardCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Clients cache
         self._clients: dict[str, BakalariClient] = clients
 
-        # Diff cache: remember seen messages per (child_key, message_id)
-        self._seen_notice_msgs: set[tuple[str, str]] = set()
+        # Diff cache: child_key -> seen message ids, persisted across restarts
+        self._seen_notice_msgs: defaultdict[str, set[str]] = defaultdict(set)
+        self._seen_store = noticeboard_seen_store(hass, entry.entry_id)
+        self._seen_loaded = False
+        # Id key that matched last time, per child (stable per server)
+        self._id_key_hint: dict[str, str] = {}
+        self._per_message_events = bool(
+            entry.options.get(CONF_NOTICEBOARD_PER_MESSAGE_EVENTS, True)
+        )
 
         # Interval with jitter so we don't stampede servers
         base = int(
@@ -55,7 +81,7 @@ class BakalariNoticeboardCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             or DEFAULT_SCAN_INTERVAL
         )
-        jittered = int(base * (0.9 + 0.2 * random()))
+        jittered = jittered_seconds(base, f"{entry.entry_id}:noticeboard")
         update_interval = timedelta(seconds=jittered)
 
         super().__init__(
@@ -63,6 +89,8 @@ class BakalariNoticeboardCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             logger=_LOGGER,
             name=f"{DOMAIN} noticeboard coordinator ({entry.entry_id})",
             update_interval=update_interval,
+            # Skip listener fan-out when the fetched snapshot did not change
+            always_update=False,
         )
 
         _LOGGER.debug(
@@ -79,7 +107,7 @@ class BakalariNoticeboardCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def get_client(self, child_key: str) -> BakalariClient | None:
         """Return a client for a given child."""
 
-        client = self._clients[child_key] or None
+        client = self._clients.get(child_key)
         if not client:
             _LOGGER.error(
                 "[class=%s module=%s] Failed to get client for child %s",
@@ -99,7 +127,8 @@ class BakalariNoticeboardCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         items: list[dict[str, Any]] = (self.data or {}).get(
             "messages_by_child", {}
         ).get(child_key, []) or []
-        if limit is not None and limit >= 0:
+        # Slice (copy) only when it actually drops items; callers must not mutate
+        if limit is not None and 0 <= limit < len(items):
             return items[:limit]
         return items
 
@@ -107,33 +136,57 @@ class BakalariNoticeboardCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Mark a message as seen to suppress 'new message' events."""
 
         if child_key and message_id:
-            self._seen_notice_msgs.add((child_key, message_id))
+            self._seen_notice_msgs[child_key].add(message_id)
+            self._schedule_seen_save()
 
     # -------- Update lifecycle --------
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch messages for each configured child."""
+        if not self._seen_loaded:
+            await self._async_load_seen()
+
         try:
             messages_by_child: dict[str, list[dict[str, Any]]] = {}
+            seen_changed = False
 
-            for child in self.children_index.children:
-                parsed = await self._fetch_child_messages(child.key)
-                # annotate new/seen
-                annotated: list[dict[str, Any]] = []
-                for m in parsed:
-                    mid = self._extract_message_id(m)
-                    is_new = bool(mid) and (
-                        (child.key, mid) not in self._seen_notice_msgs
-                    )
-                    if is_new and mid:
-                        # Remember and fire an event
-                        self._seen_notice_msgs.add((child.key, mid))
-                        self._fire_new_message_event(child.key, m)
-                    annotated.append({**m, "is_new": is_new})
-                messages_by_child[child.key] = annotated
+            children = self.children_index.children
+            extract = self._extract_message_id
+            fire = self._fire_new_message_events
+            # Fetch all children concurrently (bounded by the client)
+            results = await asyncio.gather(
+                *(self._fetch_child_messages(child.key) for child in children)
+            )
+            for child, parsed in zip(children, results, strict=True):
+                seen = self._seen_notice_msgs[child.key]
+                mids = [extract(child.key, m) for m in parsed]
+                current = {mid for mid in mids if mid}
+                new_ids = current - seen
+                new_msgs: list[dict[str, Any]] = []
+
+                # annotate new/seen in place (parsed dicts are freshly built)
+                for m, mid in zip(parsed, mids, strict=True):
+                    is_new = mid in new_ids
+                    m["is_new"] = is_new
+                    if is_new:
+                        # Fire once, even if the id repeats in the batch
+                        new_ids.discard(mid)
+                        new_msgs.append(m)
+                if new_msgs:
+                    fire(child.key, new_msgs)
+                messages_by_child[child.key] = parsed
+
+                # Remember the ids on the board (new ones included) and forget
+                # those that left it; an empty result is what the client
+                # returns on errors, so keep the ids then.
+                if current and current != seen:
+                    self._seen_notice_msgs[child.key] = current
+                    seen_changed = True
         except Exception as err:  # noqa: BLE001
             raise UpdateFailed(str(err)) from err
         else:
+            if seen_changed:
+                self._schedule_seen_save()
             return {
                 "messages_by_child": messages_by_child,
                 "last_sync_ok": True,
@@ -148,8 +201,8 @@ class BakalariNoticeboardCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         raw_items = await client.async_fetch_noticeboard()
         parsed: list[dict[str, Any]] = []
         try:
-            parsed = [orjson.loads(m.as_json()) for m in (raw_items or [])]
-        except Exception:  # noqa: BLE001
+            parsed = messages_to_dicts(raw_items)
+        except (AttributeError, TypeError, orjson.JSONDecodeError):
             _LOGGER.exception(
                 "[class=%s module=%s] Failed to parse noticeboard messages for child_key=%s",
                 self.__class__.__name__,
@@ -160,33 +213,58 @@ class BakalariNoticeboardCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     # -------- Helpers --------
 
-    @staticmethod
-    def _extract_message_id(msg: dict[str, Any]) -> str | None:
+    async def _async_load_seen(self) -> None:
+        """Load seen message ids persisted by a previous run."""
+        self._seen_loaded = True
+        try:
+            stored = await self._seen_store.async_load()
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception(
+                "[class=%s module=%s] Failed to load seen noticeboard messages",
+                self.__class__.__name__,
+                __name__,
+            )
+            return
+        for child_key, mids in (stored or {}).items():
+            self._seen_notice_msgs[child_key].update(mids)
+
+    @callback
+    def _schedule_seen_save(self) -> None:
+        """Persist seen message ids (coalesced)."""
+        self._seen_store.async_delay_save(
+            lambda: {ck: sorted(mids) for ck, mids in self._seen_notice_msgs.items()},
+            SEEN_SAVE_DELAY,
+        )
+
+    def _extract_message_id(self, child_key: str, msg: dict[str, Any]) -> str | None:
         """Try to extract some stable identifier from the message."""
-        for key in ("id", "message_id", "uuid", "guid", "Id", "MessageId"):
-            v = msg.get(key)
-            if v is None:
-                continue
-            s = str(v).strip()
-            if s:
-                return s
-        # Fallback: compose from typical fields, may be unstable but better than nothing
-        composed = "-".join(
-            str(msg.get(k, "")).strip() for k in ("subject", "title", "date", "created")
-        ).strip("-")
-        return composed or None
+        found = extract_message_id(msg, self._id_key_hint.get(child_key))
+        if found is not None:
+            mid, self._id_key_hint[child_key] = found
+            return mid
+        # Fallback: digest of typical fields, may be unstable but better than nothing
+        return composed_message_id(msg)
 
     @callback
-    def _fire_new_message_event(self, child_key: str, msg: dict[str, Any]) -> None:
-        """Emit HA event for a newly observed message."""
+    def _fire_new_message_events(
+        self, child_key: str, msgs: list[dict[str, Any]]
+    ) -> None:
+        """Emit one HA event for the newly observed messages of a child."""
+        fire = self.hass.bus.async_fire
         try:
-            self.hass.bus.async_fire(
-                "bakalari_new_noticeboard_message",
-                {"child_key": child_key, "message": msg},
+            fire(
+                "bakalari_new_noticeboard_messages",
+                {"child_key": child_key, "messages": msgs},
             )
+            if self._per_message_events:
+                for msg in msgs:
+                    fire(
+                        "bakalari_new_noticeboard_message",
+                        {"child_key": child_key, "message": msg},
+                    )
         except Exception:  # noqa: BLE001
             _LOGGER.exception(
-                "[class=%s module=%s] Failed to fire new noticeboard message event for child_key=%s",
+                "[class=%s module=%s] Failed to fire new noticeboard message events for child_key=%s",
                 self.__class__.__name__,
                 __name__,
                 child_key,
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from datetime import date, timedelta
 import logging
-from random import random
+from time import monotonic
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -18,6 +19,7 @@ from .const import (
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
 )
+from .utils import jittered_seconds
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,6 +27,10 @@ _LOGGER = logging.getLogger(__name__)
 CONF_SCAN_INTERVAL_TIMETABLE = "scan_interval_timetable"
 # Default to 6 hours for timetable polling
 TIMETABLE_DEFAULT_SCAN_INTERVAL = 6 * 60 * 60  # 6h
+# Weeks other than the current one are refetched at most once per day
+WEEK_CACHE_TTL = 24 * 60 * 60
+# Cached weeks starting before this many days ago are dropped
+WEEK_CACHE_MAX_AGE_DAYS = 14
 
 
 class BakalariTimetableCoordinator(DataUpdateCoordinator[dict[str, Any]]):
@@ -45,6 +51,8 @@ class BakalariTimetableCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.children_index: ChildrenIndex = children
         # Clients cache
         self._clients: dict[str, BakalariClient] = clients
+        # Fetched weeks: (child_key, week start) -> (monotonic time, week)
+        self._week_cache: dict[tuple[str, date], tuple[float, Any]] = {}
 
         # Interval with jitter so we don't stampede servers
         base = int(
@@ -53,7 +61,7 @@ class BakalariTimetableCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             or DEFAULT_SCAN_INTERVAL
         )
-        jittered = int(base * (0.9 + 0.2 * random()))
+        jittered = jittered_seconds(base, f"{entry.entry_id}:timetable")
         update_interval = timedelta(seconds=jittered)
 
         super().__init__(
@@ -61,6 +69,8 @@ class BakalariTimetableCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             logger=_LOGGER,
             name=f"{DOMAIN} timetable coordinator ({entry.entry_id})",
             update_interval=update_interval,
+            # Skip listener fan-out when the fetched snapshot did not change
+            always_update=False,
         )
 
         _LOGGER.debug(
@@ -75,7 +85,7 @@ class BakalariTimetableCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def get_client(self, child_key: str) -> BakalariClient | None:
         """Return a client for a given child."""
 
-        client = self._clients[child_key] or None
+        client = self._clients.get(child_key)
         if not client:
             _LOGGER.error(
                 "[class=%s module=%s] Failed to get client for child %s",
@@ -96,7 +106,8 @@ class BakalariTimetableCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         items: list[Any] = (self.data or {}).get("timetable_by_child", {}).get(
             child_key, []
         ) or []
-        if limit is not None and limit >= 0:
+        # Slice (copy) only when it actually drops items; callers must not mutate
+        if limit is not None and 0 <= limit < len(items):
             return items[:limit]
         return items
 
@@ -107,16 +118,26 @@ class BakalariTimetableCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         try:
             timetable_by_child: dict[str, list[Any]] = {}
             permanent_by_child: dict[str, Any] = {}
-            window_dates_by_child: dict[str, list[str]] = {}
+            window_dates_by_child: dict[str, tuple[str, ...]] = {}
 
             today = ha_dt.now().date()
-            dates = [today, today + timedelta(weeks=1), today - timedelta(weeks=1)]
-
-            for child in self.children_index.children:
-                weeks, permanent = await self._fetch_child_timetable(child.key, dates)
+            this_week = _week_start(today)
+            dates = (today, today + timedelta(weeks=1), today - timedelta(weeks=1))
+            # Same window for every child; share one immutable tuple
+            dates_iso = tuple(d.isoformat() for d in dates)
+
+            children = self.children_index.children
+            # Fetch all children concurrently (bounded by the client)
+            results = await asyncio.gather(
+                *(
+                    self._fetch_child_timetable(child.key, dates, this_week)
+                    for child in children
+                )
+            )
+            for child, (weeks, permanent) in zip(children, results, strict=True):
                 timetable_by_child[child.key] = weeks
                 permanent_by_child[child.key] = permanent
-                window_dates_by_child[child.key] = [d.isoformat() for d in dates]
+                window_dates_by_child[child.key] = dates_iso
         except Exception as err:  # noqa: BLE001
             raise UpdateFailed(str(err)) from err
         else:
@@ -128,21 +149,50 @@ class BakalariTimetableCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             }
 
     async def _fetch_child_timetable(
-        self, child_key: str, dates: list[Any]
+        self, child_key: str, dates: tuple[date, ...], this_week: date
     ) -> tuple[list[Any], Any]:
-        """Fetch and return (weeks, permanent) timetable for a single child."""
+        """Fetch and return (weeks, permanent) timetable for a single child.
+
+        `this_week` is the Monday of the current week, which is always refetched.
+        """
 
         client = self.get_client(child_key)
         if client is None:
             return [], None
 
-        # Actual weeks for an observation window
-        weeks: list[Any] = []
-        for d in dates:
-            w = await client.async_get_timetable_actual(d)
-            weeks.append(w)
+        # Weeks other than the current one rarely change; reuse them for a day
+        now = monotonic()
+        cache = self._week_cache
+        weeks: list[Any] = [None] * len(dates)
+        missing: list[tuple[int, date, tuple[str, date]]] = []
+        for i, d in enumerate(dates):
+            key = (child_key, _week_start(d))
+            hit = cache.get(key)
+            if (
+                hit is not None
+                and key[1] != this_week
+                and now - hit[0] < WEEK_CACHE_TTL
+            ):
+                weeks[i] = hit[1]
+            else:
+                missing.append((i, d, key))
+
+        # Calls of one client are serialized by its fetch lock, so fetch in order
+        for i, d, key in missing:
+            week = await client.async_get_timetable_actual(d)
+            weeks[i] = week
+            # Empty week is the client's error default; do not keep it
+            if getattr(week, "days", None):
+                cache[key] = (now, week)
+
+        oldest = this_week - timedelta(days=WEEK_CACHE_MAX_AGE_DAYS)
+        for key in [k for k in cache if k[1] < oldest]:
+            del cache[key]
 
-        # Permanent timetable (if available)
         permanent = await client.async_get_timetable_permanent()
-
         return weeks, permanent
+
+
+def _week_start(d: date) -> date:
+    """Return the Monday of the week containing the date."""
+    return d - timedelta(days=d.weekday())
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any
-
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -27,14 +27,25 @@ class BakalariEntity(CoordinatorEntity[DataUpdateCoordinator]):
         entry_id = getattr(entry, "entry_id", "unknown")
         self._entry_id = entry_id
         self._device_ident = device_ident(entry_id, child.key)
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information for the specific child."""
-        return {
-            "identifiers": {self._device_ident},
-            "manufacturer": MANUFACTURER,
-            "name": f"Bakaláři – {self.child.display_name}",
-            "model": MODEL,
-            "sw_version": SW_VERSION,
-        }
+        # Device info never changes for a child, so build it once
+        self._attr_device_info = DeviceInfo(
+            identifiers={self._device_ident},
+            manufacturer=MANUFACTURER,
+            name=f"Bakaláři – {child.display_name}",
+            model=MODEL,
+            sw_version=SW_VERSION,
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Handle entity added to Home Assistant."""
+        await super().async_added_to_hass()
+        self._update_from_coordinator()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached state, then write it."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
+
+    def _update_from_coordinator(self) -> None:
+        """Cache state derived from coordinator data (override in entities)."""
@@ -2,25 +2,80 @@
 
 from __future__ import annotations
 
-from typing import Any
+import os
+from typing import Any, cast
 
 from async_bakalari_api import Bakalari, Credentials, Ex, Schools
 from homeassistant import config_entries
 from homeassistant.helpers.storage import Store
+from homeassistant.util.hass_dict import HassKey
 import voluptuous as vol
 
+from .children import ChildrenIndex
 from .const import (
     CONF_CHILDREN,
     CONF_NAME,
+    CONF_NOTICEBOARD_PER_MESSAGE_EVENTS,
     CONF_SCHOOL,
     CONF_SERVER,
     CONF_SURNAME,
     CONF_USERNAME,
+    DOMAIN,
     SCHOOLS_CACHE_FILE,
     ChildRecord,
+    ChildrenMap,
 )
 from .utils import child_from_raw, ensure_children_dict
 
+# hass.data key of the shared (cache file mtime, Schools) pair
+SCHOOLS_DATA_KEY: HassKey[tuple[float | None, _IndexedSchools]] = HassKey(
+    f"{DOMAIN}_schools"
+)
+
+
+def _file_mtime(path: str) -> float | None:
+    """Return modification time of a file, None if it does not exist."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+class _IndexedSchools(Schools):
+    """Schools with memoized lookups used to render the options forms."""
+
+    def __init__(self) -> None:
+        """Initialize the memoized lookups."""
+        super().__init__()
+        self._towns: tuple[str, ...] | None = None
+        self._names_by_town: dict[str, tuple[str, ...]] = {}
+
+    def town_names(self) -> tuple[str, ...]:
+        """Return all towns."""
+        if self._towns is None:
+            self._towns = tuple(self.get_all_towns())
+        return self._towns
+
+    def school_names(self, town: str) -> tuple[str, ...]:
+        """Return names of schools in a town."""
+        names = self._names_by_town.get(town)
+        if names is None:
+            names = tuple(school.name for school in self.get_schools_by_town(town))
+            self._names_by_town[town] = names
+        return names
+
+
+def _build_schools(items: list[dict[str, Any]]) -> _IndexedSchools:
+    """Build a Schools instance from cached school records."""
+    schools = _IndexedSchools()
+    for item in items:
+        schools.append_school(
+            name=item.get("name"),
+            api_point=item.get("api_point"),
+            town=item.get("town"),
+        )
+    return schools
+
 
 class BakalariOptionsFlow(config_entries.OptionsFlow):
     """Options flow for Bakalari.
@@ -31,30 +86,58 @@ class BakalariOptionsFlow(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize BakalariOptionsFlow."""
 
-        self.children = ensure_children_dict(
-            config_entry.options.get(CONF_CHILDREN, {})
-        )  # list(config_entry.options.get("children", []))
+        self._entry_id = config_entry.entry_id
+        self._options: dict[str, Any] = dict(config_entry.options)
+        self._children_options = config_entry.options.get(CONF_CHILDREN)
+        self._children: ChildrenMap | None = None
         self._edit_index = None
-        self._schools: Schools | None = None
+        self._schools: _IndexedSchools | None = None
         self._new_child: dict[str, Any] | None = None
         self._edit_school_for: str | None = None
 
+    @property
+    def children(self) -> ChildrenMap:
+        """Return an editable copy of the children options.
+
+        Reuses the records normalized at entry setup while the options are
+        unchanged, and validates the raw options otherwise.
+        """
+        if self._children is None:
+            entry_data = self.hass.data.get(DOMAIN, {}).get(self._entry_id) or {}
+            index: ChildrenIndex | None = entry_data.get("children")
+            if index is not None and index.built_from(self._children_options):
+                self._children = {
+                    cid: cast(ChildRecord, dict(rec))
+                    for cid, rec in index.children_map.items()
+                }
+            else:
+                self._children = ensure_children_dict(self._children_options or {})
+        return self._children
+
+    def _entry_options(self) -> dict[str, Any]:
+        """Return the entry options with the edited children."""
+        return {**self._options, CONF_CHILDREN: self.children}
+
     async def create_schools_instance(self) -> None:
-        """Create a new instance of Schools from the cache."""
+        """Create a new instance of Schools from the cache.
+
+        The built instance is shared in hass.data and reused while the cache
+        file is unchanged.
+        """
 
         # Import schools from cache as we should have them from initial setup
         schools_store = Store(self.hass, 1, SCHOOLS_CACHE_FILE)
-        schools_cache = await schools_store.async_load() or []
+        mtime = await self.hass.async_add_executor_job(_file_mtime, schools_store.path)
 
-        _schools_cache = Schools()
+        cached = self.hass.data.get(SCHOOLS_DATA_KEY)
+        if cached is not None and cached[0] == mtime:
+            self._schools = cached[1]
+            return
 
-        for item in schools_cache:
-            _schools_cache.append_school(
-                name=item.get("name"),
-                api_point=item.get("api_point"),
-                town=item.get("town"),
-            )
-        self._schools = _schools_cache
+        schools_cache = await schools_store.async_load() or []
+        schools = await self.hass.async_add_executor_job(_build_schools, schools_cache)
+        self.hass.data[SCHOOLS_DATA_KEY] = (mtime, schools)
+        self._schools = schools
 
     async def async_step_init(self, user_input: dict[str, Any] | None = None):
         """Initialize BakalariOptionsFlow.
@@ -68,6 +151,7 @@ class BakalariOptionsFlow(config_entries.OptionsFlow):
             "add": "Přidat nové dítě",
             "edit": "Upravit dítě",
             "delete": "Smazat dítě",
+            "settings": "Nastavení",
         }
 
         data_schema = vol.Schema({vol.Required("action"): vol.In(actions)})
@@ -79,9 +163,33 @@ class BakalariOptionsFlow(config_entries.OptionsFlow):
                 return await self.async_step_select_child_to_edit()
             if action == "delete":
                 return await self.async_step_select_child_to_delete()
+            if action == "settings":
+                return await self.async_step_settings()
 
         return self.async_show_form(step_id="init", data_schema=data_schema)
 
+    async def async_step_settings(self, user_input=None):
+        """Step to edit integration settings."""
+
+        data_schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_NOTICEBOARD_PER_MESSAGE_EVENTS,
+                    default=self._options.get(
+                        CONF_NOTICEBOARD_PER_MESSAGE_EVENTS, True
+                    ),
+                ): bool,
+            }
+        )
+
+        if user_input is not None:
+            self._options[CONF_NOTICEBOARD_PER_MESSAGE_EVENTS] = user_input[
+                CONF_NOTICEBOARD_PER_MESSAGE_EVENTS
+            ]
+            return self.async_create_entry(title="", data=self._entry_options())
+
+        return self.async_show_form(step_id="settings", data_schema=data_schema)
+
     async def async_step_select_child_to_edit(self, user_input=None):
         """Step to select child for editing."""
 
@@ -125,7 +233,7 @@ class BakalariOptionsFlow(config_entries.OptionsFlow):
         """Step select city."""
 
         data_schema = vol.Schema(
-            {vol.Required("city"): vol.In(self._schools.get_all_towns())}
+            {vol.Required("city"): vol.In(self._schools.town_names())}
         )
 
         # we have city selected
@@ -139,10 +247,7 @@ class BakalariOptionsFlow(config_entries.OptionsFlow):
     async def async_step_select_school(self, user_input=None):
         """Step select school."""
 
-        _schools = [
-            school.name
-            for school in self._schools.get_schools_by_town(self._selected_city)
-        ]
+        _schools = self._schools.school_names(self._selected_city)
 
         data_schema = vol.Schema({vol.Required(CONF_SCHOOL): vol.In(_schools)})
 
@@ -157,7 +262,7 @@ class BakalariOptionsFlow(config_entries.OptionsFlow):
                     url if isinstance(url, str) and url else ""
                 )
 
-                self.async_create_entry(title="", data={CONF_CHILDREN: self.children})
+                self.async_create_entry(title="", data=self._entry_options())
                 return await self.async_step_edit_child()
 
             self._new_child[CONF_SCHOOL] = user_input[CONF_SCHOOL]  # pyright: ignore[reportOptionalSubscript]
@@ -207,9 +312,7 @@ class BakalariOptionsFlow(config_entries.OptionsFlow):
             child_id, child = child_from_raw(self._new_child)
             self.children[child_id] = child
 
-            return self.async_create_entry(
-                title="", data={CONF_CHILDREN: self.children}
-            )
+            return self.async_create_entry(title="", data=self._entry_options())
 
         # we have to login
         return self.async_show_form(step_id="login", data_schema=data_schema)
@@ -249,12 +352,10 @@ class BakalariOptionsFlow(config_entries.OptionsFlow):
             self.children[child_id] = child  # type: ignore[assignment]
 
             if not user_input.get(school_label, False):
-                return self.async_create_entry(
-                    title="", data={CONF_CHILDREN: self.children}
-                )
+                return self.async_create_entry(title="", data=self._entry_options())
 
             self._edit_school_for = child_id
-            self.async_create_entry(title="", data={CONF_CHILDREN: self.children})
+            self.async_create_entry(title="", data=self._entry_options())
             return await self.async_step_select_city()
 
         return self.async_show_form(step_id="edit_child", data_schema=data_schema)
@@ -272,9 +373,7 @@ class BakalariOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             child_id = user_input["child_id"]
             self.children.pop(child_id)
-            return self.async_create_entry(
-                title="", data={CONF_CHILDREN: self.children}
-            )
+            return self.async_create_entry(title="", data=self._entry_options())
 
         return self.async_show_form(
             step_id="select_child_to_delete", data_schema=data_schema
@@ -7,14 +7,16 @@ from typing import Any
 
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .const import DOMAIN, EMPTY_DATA
 from .coordinator_marks import BakalariMarksCoordinator
 from .coordinator_messages import BakalariMessagesCoordinator
 from .coordinator_noticeboard import BakalariNoticeboardCoordinator
 from .coordinator_timetable import BakalariTimetableCoordinator
 from .sensor_helpers import (
+    build_registry_listener,
     build_subjects_listener,
     get_child_subjects,
     seed_created_subjects_from_data,
@@ -48,17 +50,11 @@ async def async_setup_entry(
     coord_noticeb: BakalariNoticeboardCoordinator = data.get("noticeboard")
 
     entities = []
-    data_now = coord_marks.data or {}
+    data_now = coord_marks.data if coord_marks.data is not None else EMPTY_DATA
 
     # Create sensors for children.
     for child in children:
         # Base senors
-        _LOGGER.debug(
-            "[class=%s module=%s] Creating base sensors for child %s",
-            async_setup_entry.__qualname__,
-            __name__,
-            child,
-        )
         if coord_marks is not None:
             entities.append(BakalariNewMarksSensor(coord_marks, child))
             entities.append(BakalariLastMarkSensor(coord_marks, child))
@@ -73,7 +69,7 @@ async def async_setup_entry(
         # Per-subject sensors
         subjects_dict: dict[str, Any] = get_child_subjects(coord_marks, child)
         _LOGGER.debug(
-            "[class=%s module=%s] Setting up subjects for child: %s: %s",
+            "[class=%s module=%s] Setting up sensors for child: %s, subjects: %s",
             async_setup_entry.__qualname__,
             __name__,
             child,
@@ -81,21 +77,21 @@ async def async_setup_entry(
         )
 
         subjects: dict[str, dict[str, Any]] = subjects_dict.get("mapping_names", {})
-        subj_sensors: list[dict[str, str]] = [
-            {"id": s_id, "abbr": s_data["abbr"]} for s_id, s_data in subjects.items()
-        ]
-
         entities.extend(
-            BakalariSubjectMarksSensor(
-                coord_marks, child, subject_sensor["id"], subject_sensor["abbr"]
-            )
-            for subject_sensor in subj_sensors
+            BakalariSubjectMarksSensor(coord_marks, child, s_id, s_data["abbr"])
+            for s_id, s_data in subjects.items()
         )
 
     async_add_entities(entities, update_before_add=True)
 
-    # Dynamic per-subject sensors (no reload required)
+    # Track subjects appearing in later coordinator data
     created_subjects = seed_created_subjects_from_data(coord_marks, data_now)
     coord_marks.async_add_listener(
-        build_subjects_listener(coord_marks, created_subjects, async_add_entities)
+        build_subjects_listener(coord_marks, created_subjects)
+    )
+    # Keep the cached subject sensors map in sync with the entity registry
+    entry.async_on_unload(
+        hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, build_registry_listener(coord_marks)
+        )
     )
@@ -2,47 +2,115 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
 import logging
+from operator import attrgetter
 import re
 from typing import Any
+import weakref
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import Event, callback
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .const import EMPTY_DATA
 from .coordinator_marks import BakalariMarksCoordinator, Child
+from .utils import mark_subject_key
 
 _LOGGER = logging.getLogger(__name__)
 
+# Characters not allowed in the subject part of unique ids
+_SANITIZE_RE = re.compile(r"[^a-zA-Z0-9_-]")
+# First number in a mark text ("1-", "2+", "15/20", "18 b.")
+_NUM_RE = re.compile(r"(\d+[.,]?\d*)")
+# Natural subject ordering of marks aggregates (see _SubjAgg.sort_key)
+_SUBJ_SORT_KEY = attrgetter("sort_key")
+
+
+@dataclass(slots=True)
+class _CoordinatorCaches:
+    """Values derived from one marks coordinator, reused while their inputs hold."""
+
+    # (data, child_key -> derived subjects), valid while `data` is coordinator.data
+    subjects: tuple[dict[str, Any], dict[str, list[tuple[str, str]]]] | None = None
+    # child_key -> subject_key -> entity_id, dropped on entity registry updates
+    sensor_map: dict[str, dict[str, str]] | None = None
+    # child_key -> (marks list, aggregation), valid while the list is the same object
+    agg: dict[str, tuple[list[dict[str, Any]], dict[str, Any]]] = field(
+        default_factory=dict
+    )
+
+
+# Caches per coordinator; they go away together with their (unloaded) coordinator
+_CACHES: weakref.WeakKeyDictionary[BakalariMarksCoordinator, _CoordinatorCaches] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _caches(coord: BakalariMarksCoordinator) -> _CoordinatorCaches:
+    """Return the derived-data caches of a coordinator."""
+    caches = _CACHES.get(coord)
+    if caches is None:
+        caches = _CACHES[coord] = _CoordinatorCaches()
+    return caches
+
 
 def _subjects_sensors_map(
     coordinator: BakalariMarksCoordinator, child: Child
 ) -> dict[str, str]:
     """Generate a mapping of sensors names to subject names."""
+    caches = _caches(coordinator)
+    cache = caches.sensor_map
+    if cache is None:
+        cache = caches.sensor_map = _build_subjects_sensors_map(coordinator)
+    return cache.get(child.key, {})
+
+
+def _build_subjects_sensors_map(
+    coordinator: BakalariMarksCoordinator,
+) -> dict[str, dict[str, str]]:
+    """Map child_key -> subject_key -> entity_id in one entity registry pass."""
     entry_id = coordinator.entry.entry_id
 
     reg = er.async_get(coordinator.hass)
-    result: dict[str, str] = {}
-    for ent in reg.entities.values():
-        if ent.config_entry_id != entry_id:
-            continue
-        if ent.domain != "sensor" or ent.platform != "bakalari":
+    result: dict[str, dict[str, str]] = {}
+    # The registry keeps an index by config entry, so only our entities are walked
+    for ent in er.async_entries_for_config_entry(reg, entry_id):
+        if ent.platform != "bakalari" or ent.domain != "sensor":
             continue
 
-        uid = ent.unique_id
-        needle = f":{child.key}:subject:"
-        if needle not in uid:
+        # unique_id: "<entry_id>:<child_key>:subject:<subject_key>"
+        head, sep, subject_key = ent.unique_id.partition(":subject:")
+        if not sep:
             continue
-
-        subject_key = uid.split(":subject:", 1)[1]
+        child_key = head.partition(":")[2]
         name = ent.entity_id  #  or we can fetch getattr(ent, "original_name", None) or getattr(ent, "name", None)
 
-        result[str(subject_key)] = name
+        result.setdefault(child_key, {})[str(subject_key)] = name
 
     return result
 
 
+def build_registry_listener(
+    coord: BakalariMarksCoordinator,
+) -> Callable[[Event[er.EventEntityRegistryUpdatedData]], None]:
+    """Build a listener that drops the cached subject sensors map on registry changes.
+
+    Args:
+        coord: Bakalari coordinator instance.
+
+    Returns:
+        A callback to register for entity registry updated events.
+
+    """
+
+    @callback
+    def _on_registry_updated(event: Event[er.EventEntityRegistryUpdatedData]) -> None:
+        _caches(coord).sensor_map = None
+
+    return _on_registry_updated
+
+
 def get_child_subjects(
     coordinator: BakalariMarksCoordinator, child: Child
 ) -> dict[str, Any]:
@@ -54,12 +122,12 @@ def get_child_subjects(
         child.key, {}
     )
     if not subjs:
-        _LOGGER.error(
-            "[class=%s module=%s] No subjects found for child %s. Data received: %s",
+        # Read on every attribute access of the index sensor, so keep it quiet
+        _LOGGER.debug(
+            "[class=%s module=%s] No subjects found for child %s",
             get_child_subjects.__qualname__,
             __name__,
             child.key,
-            subjs,
         )
         return {}
 
@@ -84,60 +152,86 @@ def get_child_subjects(
     }
 
 
+def _clean_str(value: Any) -> str:
+    """Return a stripped string, converting only non-string values."""
+    if isinstance(value, str):
+        return value.strip()
+    return str(value).strip() if value else ""
+
+
 def derive_subjects_from_data(
-    data: dict[str, Any], child_key: str
+    subjects_map: Mapping[str, Any], marks: Sequence[dict[str, Any]]
 ) -> list[tuple[str, str]]:
-    """Return a list of tuples (subject_key, label) derived from current coordinator data.
+    """Return a list of tuples (subject_key, label) derived from a child's data.
 
     Subject key is stable priority order: subject_id or subject_abbr or subject_name or "unknown".
     Label prefers subject_abbr, then subject_name, finally the subject_key.
 
     Args:
-        data: Snapshot of coordinator.data
-        child_key: Composite child key for which to derive subjects.
+        subjects_map: The child's entry of coordinator.data["subjects_by_child"].
+        marks: The child's entry of coordinator.data["marks_flat_by_child"],
+            used when no subjects are known.
 
     Returns:
         A list of (subject_key, label) pairs.
 
     """
-    subjects_map: dict[str, Any] = (data.get("subjects_by_child") or {}).get(
-        child_key, {}
-    ) or {}
     derived: list[tuple[str, str]] = []
 
     if isinstance(subjects_map, dict) and subjects_map:
-        for s in list(subjects_map.values()):
-            sid = (
-                str(
-                    s.get("id") or s.get("subject_id") or s.get("subject") or ""
-                ).strip()
-                or None
-            )
-            sabbr = str(s.get("abbr") or s.get("subject_abbr") or "").strip()
-            sname = str(s.get("name") or s.get("subject_name") or "").strip()
-            skey = sid or sabbr or sname or "unknown"
-            label = sabbr or sname or skey
-            derived.append((skey, label))
+        for s in subjects_map.values():
+            get = s.get
+            sid = str(get("id") or get("subject_id") or get("subject") or "").strip()
+            # The name is only looked at when there is no abbreviation
+            label = (get("abbr") or get("subject_abbr") or "").strip() or (
+                get("name") or get("subject_name") or ""
+            ).strip()
+            skey = sid or label or "unknown"
+            derived.append((skey, label or skey))
         return derived
 
-    marks: Sequence[dict[str, Any]] = (data.get("marks_flat_by_child") or {}).get(
-        child_key, []
-    ) or []
     seen_keys: set[str] = set()
     for it in marks:
-        sid = str(it.get("subject_id") or it.get("subject") or "").strip() or None
-        sabbr = str(it.get("subject_abbr") or "").strip()
-        sname = str(it.get("subject_name") or "").strip()
-        skey = sid or sabbr or sname or "unknown"
+        get = it.get
+        # Most marks repeat an already known subject; skip them early
+        skey = get("subject_key") or mark_subject_key(it)
         if skey in seen_keys:
             continue
         seen_keys.add(skey)
-        label = sabbr or sname or skey
+        label = (
+            _clean_str(get("subject_abbr")) or _clean_str(get("subject_name")) or skey
+        )
         derived.append((skey, label))
 
     return derived
 
 
+def derive_all_subjects(
+    coord: BakalariMarksCoordinator, data: Mapping[str, Any] | None
+) -> dict[str, list[tuple[str, str]]]:
+    """Return child_key -> derived subjects, computed once per coordinator data.
+
+    The result is cached per coordinator and reused while `data` is the same
+    object, so setup and every listener run share a single derivation.
+    """
+    if data is None:
+        data = EMPTY_DATA
+    caches = _caches(coord)
+    cache = caches.subjects
+    if cache is not None and cache[0] is data:
+        return cache[1]
+    subjects_by_child = data.get("subjects_by_child") or EMPTY_DATA
+    marks_flat_by_child = data.get("marks_flat_by_child") or EMPTY_DATA
+    derived = {
+        ck: derive_subjects_from_data(
+            subjects_by_child.get(ck) or EMPTY_DATA, marks_flat_by_child.get(ck) or ()
+        )
+        for ck in (ch.key for ch in coord.child_list)
+    }
+    caches.subjects = (data, derived)
+    return derived
+
+
 def create_subject_entities_for_child(
     coord: BakalariMarksCoordinator, child: Child, data_now: dict[str, Any]
 ) -> list[tuple[str, str]]:
@@ -152,11 +246,11 @@ def create_subject_entities_for_child(
         List of per-subject SensorEntity instances.
 
     """
-    return derive_subjects_from_data(data_now, child.key)
+    return derive_all_subjects(coord, data_now).get(child.key, [])
 
 
 def seed_created_subjects_from_data(
-    coord: BakalariMarksCoordinator, data_now: dict[str, Any]
+    coord: BakalariMarksCoordinator, data_now: Mapping[str, Any]
 ) -> dict[str, set[str]]:
     """Initialize a mapping child_key -> set(subject_key) from the current data snapshot.
 
@@ -169,50 +263,50 @@ def seed_created_subjects_from_data(
 
     """
 
-    created: dict[str, set[str]] = {}
-    for ch in coord.child_list:
-        keys = {
-            skey for (skey, _label) in derive_subjects_from_data(coord.data, ch.key)
-        }
-        created[ch.key] = set(keys)
-    return created
+    return {
+        ck: {skey for (skey, _label) in subjects}
+        for ck, subjects in derive_all_subjects(coord, data_now).items()
+    }
 
 
 def build_subjects_listener(
     coord: BakalariMarksCoordinator,
     created_subjects: dict[str, set[str]],
-    async_add_entities: AddEntitiesCallback,
 ) -> Callable[[], None]:
-    """Build a listener that adds new per-subject sensors when new subjects appear.
+    """Build a listener that records subjects appearing in new coordinator data.
 
     Args:
         coord: Bakalari coordinator instance.
-        created_subjects: Mutable map child_key -> set(subject_key) tracking already created sensors.
-        async_add_entities: Home Assistant callback to add new entities.
+        created_subjects: Mutable map child_key -> set(subject_key) tracking already seen subjects.
 
     Returns:
         A zero-arg callable to register with coordinator's update listener API.
 
     """
 
+    last_data: dict[str, Any] | None = None
+
     def _on_coordinator_update() -> None:
-        to_add: list[SensorEntity] = []
+        nonlocal last_data
+        data = coord.data
+        # Listeners also run on failed refreshes that keep the previous data
+        if data is last_data:
+            return
+        last_data = data
+
+        derived = derive_all_subjects(coord, data)
         for child in coord.child_list:
-            existing = created_subjects.setdefault(child.key, set())
-            for skey, _label in derive_subjects_from_data(coord.data, child.key):
-                if skey in existing:
-                    continue
-                # to_add.append(BakalariSubjectMarksSensor(coord, child, skey, label))
-                existing.add(skey)
-        if to_add:
-            async_add_entities(to_add)
+            ck = child.key
+            created_subjects.setdefault(ck, set()).update(
+                skey for skey, _label in derived.get(ck, ())
+            )
 
     return _on_coordinator_update
 
 
 def sanitize(sanitize: str) -> str:
     """Return sanitized slug."""
-    return re.sub(r"[^a-zA-Z0-9_-]", "_", sanitize)
+    return _SANITIZE_RE.sub("_", sanitize)
 
 
 def aggregate_marks_for_child(
@@ -220,11 +314,67 @@ def aggregate_marks_for_child(
     child_key: str,
     items: list[dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
-    """Aggregate marks by subject and compute overall statistics for a child."""
+    """Aggregate marks by subject and compute overall statistics for a child.
+
+    The result is cached per coordinator and child and reused while the marks
+    list is the same object, so all sensors of a child share one aggregation per
+    update. Callers must not mutate it.
+    """
     if not items:
         items = _get_items_for_child(coord, child_key)
+    agg_cache = _caches(coord).agg
+    cached = agg_cache.get(child_key)
+    if cached is not None and cached[0] is items:
+        return cached[1]
+    result = _aggregate_items(items)
+    agg_cache[child_key] = (items, result)
+    return result
+
+
+@dataclass(slots=True)
+class _SubjAgg:
+    """Running marks aggregate of one subject."""
+
+    subject_id: str | None
+    subject_key: str
+    subject_abbr: str | None
+    subject_name: str | None
+    # (abbr, name) with empty strings for missing values, for natural ordering
+    sort_key: tuple[str, str]
+    count: int = 0
+    new_count: int = 0
+    numeric_count: int = 0
+    non_numeric_count: int = 0
+    sum_: float = 0.0
+    wsum: float = 0.0
+    weight: float = 0.0
+    last_text: str | None = None
+    last_date: Any = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the public attributes dict with averages (sums left out)."""
+        n = self.numeric_count
+        w = self.weight
+        avg = round(self.sum_ / n, 3) if n > 0 else None
+        return {
+            "subject_id": self.subject_id,
+            "subject_key": self.subject_key,
+            "subject_abbr": self.subject_abbr,
+            "subject_name": self.subject_name,
+            "count": self.count,
+            "new_count": self.new_count,
+            "numeric_count": n,
+            "non_numeric_count": self.non_numeric_count,
+            "last_text": self.last_text,
+            "last_date": self.last_date,
+            "avg": avg,
+            "wavg": round(self.wsum / w, 3) if w and w > 0 else avg,
+        }
+
 
-    by_subject: dict[str, dict[str, Any]] = {}
+def _aggregate_items(items: list[dict[str, Any]]) -> dict[str, Any]:
+    """Aggregate a child's marks by subject and compute overall statistics."""
+    by_subject: dict[str, _SubjAgg] = {}
     total = len(items)
     new_count = 0
     overall_numeric = 0
@@ -234,76 +384,55 @@ def aggregate_marks_for_child(
     overall_w = 0.0
 
     for it in items:
-        subj_id = str(it.get("subject_id") or it.get("subject") or "").strip() or None
-        subj_abbr = str(it.get("subject_abbr") or "").strip()
-        subj_name = str(it.get("subject_name") or "").strip()
-        subj_key = subj_id or subj_abbr or subj_name or "unknown"
-
-        if subj_key not in by_subject:
-            by_subject[subj_key] = {
-                "subject_id": subj_id,
-                "subject_key": subj_key,
-                "subject_abbr": subj_abbr or None,
-                "subject_name": subj_name or None,
-                "count": 0,
-                "new_count": 0,
-                "numeric_count": 0,
-                "non_numeric_count": 0,
-                "sum": 0.0,
-                "wsum": 0.0,
-                "weight": 0.0,
-                "last_text": None,
-                "last_date": None,
-            }
-
-        agg = by_subject[subj_key]
-        agg["count"] += 1
-        if it.get("is_new"):
-            agg["new_count"] += 1
+        get = it.get
+        subj_key = get("subject_key") or mark_subject_key(it)
+
+        agg = by_subject.get(subj_key)
+        if agg is None:
+            subj_id = str(get("subject_id") or get("subject") or "").strip() or None
+            subj_abbr = (get("subject_abbr") or "").strip()
+            subj_name = (get("subject_name") or "").strip()
+            agg = by_subject[subj_key] = _SubjAgg(
+                subject_id=subj_id,
+                subject_key=subj_key,
+                subject_abbr=subj_abbr or None,
+                subject_name=subj_name or None,
+                sort_key=(subj_abbr, subj_name),
+            )
+
+        agg.count += 1
+        if get("is_new"):
+            agg.new_count += 1
             new_count += 1
 
         val, w = _parse_numeric_mark(it)
         if val is None:
-            agg["non_numeric_count"] += 1
+            agg.non_numeric_count += 1
             overall_non_numeric += 1
         else:
-            agg["numeric_count"] += 1
-            agg["sum"] += val
-            agg["wsum"] += val * (w or 1.0)
-            agg["weight"] += w or 1.0
+            w = w or 1.0
+            wval = val * w
+            agg.numeric_count += 1
+            agg.sum_ += val
+            agg.wsum += wval
+            agg.weight += w
             overall_numeric += 1
             overall_sum += val
-            overall_wsum += val * (w or 1.0)
-            overall_w += w or 1.0
+            overall_wsum += wval
+            overall_w += w
 
         # Keep the latest mark info per subject (items are expected in descending time order)
-        if agg["last_text"] is None:
-            last_text = (
-                it.get("mark_text") or it.get("points_text") or ""
+        if agg.last_text is None:
+            agg.last_text = (
+                get("mark_text") or get("points_text") or ""
             ).strip() or None
-            last_date = (
-                it.get("date") or it.get("created") or it.get("inserted") or None
-            )
-            agg["last_text"] = last_text
-            agg["last_date"] = last_date
-
-    # Finalize averages
-    subjects: list[dict[str, Any]] = []
-    for s in by_subject.values():
-        n = s["numeric_count"]
-        w = s["weight"]
-        s["avg"] = round(s["sum"] / n, 3) if n > 0 else None
-        s["wavg"] = round(s["wsum"] / w, 3) if w and w > 0 else s["avg"]
-        # Remove intermediate sums to keep attributes small but useful
-        del s["sum"]
-        del s["wsum"]
-        del s["weight"]
-        subjects.append(s)
-
-    # Sort subjects naturally: first by abbr, then by name
-    subjects.sort(
-        key=lambda s: (s.get("subject_abbr") or "", s.get("subject_name") or "")
-    )
+            agg.last_date = get("date") or get("created") or get("inserted") or None
+
+    # Sort subjects naturally (first by abbr, then by name) and finalize averages;
+    # intermediate sums are left out to keep attributes small
+    subjects: list[dict[str, Any]] = [
+        agg.as_dict() for agg in sorted(by_subject.values(), key=_SUBJ_SORT_KEY)
+    ]
 
     overall = {
         "total": total,
@@ -321,50 +450,72 @@ def aggregate_marks_for_child(
     return {
         "overall": overall,
         "by_subject": subjects,
-        "recent": items[:20] if items else [],
+        "recent": items[:20],
     }
 
 
+def _mark_weight(item: dict[str, Any]) -> float:
+    """Return the mark weight from its weight/coef fields, defaulting to 1.0."""
+    get = item.get
+    w_raw = get("weight") or get("coef") or get("coefficient")
+    # Most marks carry no weight or a numeric one; skip the str() round-trip
+    if w_raw is None:
+        return 1.0
+    if isinstance(w_raw, int | float):
+        return float(w_raw)
+    try:
+        return float(w_raw) if str(w_raw).strip() != "" else 1.0
+    except Exception:  # noqa: BLE001
+        return 1.0
+
+
 def _parse_numeric_mark(item: dict[str, Any]) -> tuple[float | None, float]:
     """Extract numeric value and optional weight from a mark item. Returns (value, weight)."""
+    get = item.get
     # Direct numeric fields (prefer explicit numeric values if present)
     for key in ("value", "numeric_value", "mark_value"):
-        v = item.get(key)
+        v = get(key)
         if isinstance(v, int | float):
-            w_raw = item.get("weight") or item.get("coef") or item.get("coefficient")
-            try:
-                w = (
-                    float(w_raw)
-                    if w_raw is not None and str(w_raw).strip() != ""
-                    else 1.0
-                )
-            except Exception:  # noqa: BLE001
-                w = 1.0
-            return float(v), w
+            return float(v), _mark_weight(item)
 
     # Parse from text fields (e.g., "1-", "2+", "15/20", "18 b.") - take the first number found
-    txt = str(item.get("mark_text") or item.get("points_text") or "").strip()
-    m = re.search(r"(\d+[.,]?\d*)", txt)
-    if not m:
+    raw = get("mark_text") or get("points_text")
+    if not raw:
+        # Placeholder marks without any text
         return None, 0.0
-    try:
-        val = float(m.group(1).replace(",", "."))
-    except Exception:  # noqa: BLE001
-        return None, 0.0
-
-    w_raw = item.get("weight") or item.get("coef") or item.get("coefficient")
-    try:
-        w = float(w_raw) if w_raw is not None and str(w_raw).strip() != "" else 1.0
-    except Exception:  # noqa: BLE001
-        w = 1.0
-    return val, w
+    txt = str(raw).strip()
+    if txt.isascii() and txt.isdigit():
+        # Plain marks ("1".."5") need no regex
+        val = float(txt)
+    else:
+        m = _NUM_RE.search(txt)
+        if not m:
+            return None, 0.0
+        try:
+            val = float(m.group(1).replace(",", "."))
+        except Exception:  # noqa: BLE001
+            return None, 0.0
+
+    return val, _mark_weight(item)
+
+
+def _get_subject_items(
+    coord: BakalariMarksCoordinator, child_key: str, subject_key: str
+) -> list[dict[str, Any]]:
+    """Get a child's marks of one subject from coordinator data."""
+    data = coord.data or EMPTY_DATA
+    by_subject = (data.get("marks_by_child_subject") or EMPTY_DATA).get(
+        child_key
+    ) or EMPTY_DATA
+    items: list[dict[str, Any]] = by_subject.get(subject_key) or []
+    return items
 
 
 def _get_items_for_child(
     coord: BakalariMarksCoordinator, child_key: str
 ) -> list[dict[str, Any]]:
     """Get marks list for the child from coordinator data."""
-    data = coord.data or {}
-    by_child = data.get("marks_by_child") or {}
-    items: list[dict[str, Any]] = by_child.get(child_key, []) or []
+    data = coord.data or EMPTY_DATA
+    by_child = data.get("marks_by_child") or EMPTY_DATA
+    items: list[dict[str, Any]] = by_child.get(child_key) or []
     return items
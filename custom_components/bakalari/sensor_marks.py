@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 
+from .const import EMPTY_DATA
 from .coordinator_marks import BakalariMarksCoordinator, Child
 from .entity import BakalariEntity
 from .sensor_helpers import (
     _get_items_for_child,
+    _get_subject_items,
     aggregate_marks_for_child,
     get_child_subjects,
     sanitize,
@@ -33,21 +34,18 @@ class BakalariNewMarksSensor(BakalariEntity, SensorEntity):
         self._attr_unique_id = f"{coordinator.entry.entry_id}:{child.key}:new_marks"
         self._attr_name = f"Nové známky - {child.short_name}"
 
-    @property
-    def native_value(self) -> int:
-        """Return the count of new marks for the child."""
-        items = _get_items_for_child(self.coordinator, self.child.key)
-        # Prefer explicit "is_new" flag if provided by API; otherwise fall back to 0
-        return sum(1 for it in items if bool(it.get("is_new")))
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the attributes of the sensor."""
-        items = _get_items_for_child(self.coordinator, self.child.key)
-        recent = items[:5] if items else []
-        return {
-            "child_key": self.child.key,
-            "recent": recent,
+    def _update_from_coordinator(self) -> None:
+        """Cache the new marks count and recent marks for the child."""
+        ck = self.child.key
+        data = self.coordinator.data or EMPTY_DATA
+        items = _get_items_for_child(self.coordinator, ck)
+        # Counted by the coordinator when it flags marks as new
+        self._attr_native_value = (data.get("new_count_by_child") or EMPTY_DATA).get(
+            ck, 0
+        )
+        self._attr_extra_state_attributes = {
+            "child_key": ck,
+            "recent": items[:5],
             "total_marks_cached": len(items),
         }
 
@@ -66,24 +64,19 @@ class BakalariLastMarkSensor(BakalariEntity, SensorEntity):
         self._attr_unique_id = f"{coordinator.entry.entry_id}:{child.key}:last_mark"
         self._attr_name = f"Poslední známka - {child.short_name}"
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the native value of the sensor."""
-        items = _get_items_for_child(self.coordinator, self.child.key)
-        if not items:
-            return None
-        last = items[0]
-        subject = (last.get("subject_abbr") or last.get("subject_name") or "").strip()
-        text = (last.get("mark_text") or last.get("points_text") or "").strip()
-        value = f"{subject} {text}".strip()
-        return value or None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the extra state attributes of the sensor."""
+    def _update_from_coordinator(self) -> None:
+        """Cache the short text and details of the child's latest mark."""
         items = _get_items_for_child(self.coordinator, self.child.key)
         last = items[0] if items else None
-        return {
+        value = None
+        if last is not None:
+            subject = (
+                last.get("subject_abbr") or last.get("subject_name") or ""
+            ).strip()
+            text = (last.get("mark_text") or last.get("points_text") or "").strip()
+            value = f"{subject} {text}".strip() or None
+        self._attr_native_value = value
+        self._attr_extra_state_attributes = {
             "child_key": self.child.key,
             "last": last,
         }
@@ -112,44 +105,24 @@ class BakalariSubjectMarksSensor(BakalariEntity, SensorEntity):
         display = (label or self._subject_abbr).strip()
         self._attr_unique_id = f"{coordinator.entry.entry_id}:{child.key}:subject:{sanitize(self._subject_key)}"
         self._attr_name = f"Známky {display} - {child.short_name}"
-        self._friendly_name = f" Známky {display} - {child.short_name}"
 
-    def _matches_subject(self, item: dict[str, Any]) -> bool:
-        """Return True if the given mark item belongs to this sensor's subject."""
-        subj_id = (
-            str(item.get("subject_id") or item.get("subject") or "").strip() or None
-        )
-        subj_abbr = str(item.get("subject_abbr") or "").strip()
-        subj_name = str(item.get("subject_name") or "").strip()
-        key = subj_id or subj_abbr or subj_name or "unknown"
-        return key == self._subject_key
-
-    @property
-    def native_value(self) -> int:
-        """Return total number of marks for this subject."""
-        items = _get_items_for_child(self.coordinator, self.child.key)
-        sitems = [it for it in items if self._matches_subject(it)]
-        return len(sitems)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return subject details, stats and recent marks."""
-        items = _get_items_for_child(self.coordinator, self.child.key)
-        agg = aggregate_marks_for_child(self.coordinator, self.child.key, items)
+    def _update_from_coordinator(self) -> None:
+        """Cache the mark count, subject stats and recent marks."""
+        ck = self.child.key
+        sitems = _get_subject_items(self.coordinator, ck, self._subject_key)
+        agg = aggregate_marks_for_child(self.coordinator, ck)
         subjects = agg.get("by_subject", []) or []
         info = next(
             (s for s in subjects if s.get("subject_key") == self._subject_key),
             None,
         )
 
-        sitems = [it for it in items if self._matches_subject(it)]
-        recent = sitems if sitems else []
-
-        return {
-            "child_key": self.child.key,
+        self._attr_native_value = len(sitems)
+        self._attr_extra_state_attributes = {
+            "child_key": ck,
             "subject_key": self._subject_key,
             "subject": info,
-            "recent": recent,
+            "recent": sitems,
         }
 
 
@@ -167,15 +140,15 @@ class BakalariIndexHelperSensor(BakalariEntity, SensorEntity):
         self._attr_unique_id = f"{coordinator.entry.entry_id}:{child.key}:all_marks"
         self._attr_name = f"Všechny známky - {child.short_name}"
 
-    @property
-    def native_value(self) -> int:
-        """Return total subjects for child."""
-        items = aggregate_marks_for_child(self.coordinator, self.child.key)
-        return items["overall"]["total"]
+    def _update_from_coordinator(self) -> None:
+        """Cache the total marks count for the child."""
+        agg = aggregate_marks_for_child(self.coordinator, self.child.key)
+        self._attr_native_value = agg["overall"]["total"]
 
     @property
     def extra_state_attributes(self):
         """Return extra state attributes."""
+        # Not cached: the subject -> sensor map follows entity registry changes
 
         return get_child_subjects(self.coordinator, self.child)
 
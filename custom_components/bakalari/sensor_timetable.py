@@ -7,14 +7,15 @@ from typing import Any
 from homeassistant.components.sensor import SensorEntity
 
 from .children import Child
+from .const import EMPTY_DATA
 from .entity import BakalariEntity
 
 
 def _get_timetable_for_child(coord: Any, child_key: str) -> list[Any]:
     """Get timetable list (weeks) for the child from coordinator data."""
-    data = coord.data or {}
-    by_child = data.get("timetable_by_child") or {}
-    items: list[Any] = by_child.get(child_key, []) or []
+    data = coord.data or EMPTY_DATA
+    by_child = data.get("timetable_by_child") or EMPTY_DATA
+    items: list[Any] = by_child.get(child_key) or []
     return items
 
 
@@ -30,28 +31,14 @@ class BakalariTimetableSensor(BakalariEntity, SensorEntity):
         self._attr_unique_id = f"{coordinator.entry.entry_id}:{child.key}:timetable"
         self._attr_name = f"Rozvrh - {child.short_name}"
 
-    async def async_added_to_hass(self) -> None:
-        """Initialize the sensor for a specific child."""
-        await super().async_added_to_hass()
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self._handle_coordinator_update)
-        )
-
-    @property
-    def native_value(self) -> int:
-        """Return number of weeks cached for the child's timetable."""
-        items = _get_timetable_for_child(self.coordinator, self.child.key)
-        try:
-            return len(items)
-        except Exception:
-            return 1 if items else 0
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the timetable as attributes for advanced use."""
+    def _update_from_coordinator(self) -> None:
+        """Cache the number of weeks and the timetable for the child."""
+        # The coordinator always stores a list of weeks per child
         items = _get_timetable_for_child(self.coordinator, self.child.key)
-        return {
+        weeks = len(items)
+        self._attr_native_value = weeks
+        self._attr_extra_state_attributes = {
             "child_key": self.child.key,
             "timetable": items,
-            "total_weeks_cached": len(items) if isinstance(items, list) else 0,
+            "total_weeks_cached": weeks,
         }
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, is_dataclass
 from datetime import date
+import hashlib
+from random import Random
+import sys
 from typing import Any, cast
 import uuid
 
+from async_bakalari_api.komens import MessageContainer
+import orjson
 import voluptuous as vol
 
 from .const import (
@@ -38,6 +45,11 @@ CHILD_STORAGE_SCHEMA = vol.Schema(
 
 CHILDREN_MAP_SCHEMA = vol.Schema({str: CHILD_STORAGE_SCHEMA})
 
+# Candidate keys holding a message identifier ("mid" is used by Komens)
+_MESSAGE_ID_KEYS = ("mid", "id", "message_id", "uuid", "guid", "Id", "MessageId")
+# Fields hashed into an identifier for messages without one
+_COMPOSED_ID_FIELDS = ("subject", "title", "date", "created")
+
 
 # Child helpers
 def child_from_raw(raw: dict[str, Any] | None) -> tuple[str, ChildRecord]:
@@ -173,6 +185,99 @@ def redact_child_info(child_info: ChildRecord) -> ChildRecord:
     return redacted
 
 
+def _json_to_dict(msg: Any) -> dict[str, Any]:
+    """Parse the `as_json()` output of a message."""
+    return orjson.loads(msg.as_json())
+
+
+def _message_converter(msg: Any) -> Callable[[Any], dict[str, Any]]:
+    """Pick the cheapest dict converter for a message object.
+
+    Komens messages are parsed from `as_json()`, so the dict shape follows the
+    library and holds no references to its objects.
+    """
+    if isinstance(msg, MessageContainer):
+        return _json_to_dict
+    if is_dataclass(msg) and not isinstance(msg, type):
+        return asdict
+    model_dump = getattr(type(msg), "model_dump", None)
+    if callable(model_dump):
+        return model_dump
+    return _json_to_dict
+
+
+def message_to_dict(msg: Any) -> dict[str, Any]:
+    """Return a dict of a Komens message."""
+    return _message_converter(msg)(msg)
+
+
+def messages_to_dicts(items: Sequence[Any] | None) -> list[dict[str, Any]]:
+    """Convert a batch of messages to dicts.
+
+    A batch comes from a single API call and is homogeneous, so the converter
+    is picked once from the first item.
+    """
+    if not items:
+        return []
+    convert = _message_converter(items[0])
+    return [convert(m) for m in items]
+
+
+def extract_message_id(
+    msg: dict[str, Any], hint: str | None = None
+) -> tuple[str, str] | None:
+    """Return (message id, matched key) from the first non-empty id field.
+
+    `hint` is the key that matched last time and is tried first, as all messages
+    of a server use the same one. Returns None when no id field is set.
+    """
+    if hint is not None:
+        v = msg.get(hint)
+        if v is not None and (s := str(v).strip()):
+            return s, hint
+    for key in _MESSAGE_ID_KEYS:
+        v = msg.get(key)
+        if v is None:
+            continue
+        s = str(v).strip()
+        if s:
+            return s, key
+    return None
+
+
+def composed_message_id(msg: dict[str, Any]) -> str | None:
+    """Return a digest of the typical message fields, or None if all are empty."""
+    fields = [msg.get(k) for k in _COMPOSED_ID_FIELDS]
+    if not any(fields):
+        return None
+    return hashlib.blake2b(orjson.dumps(fields, default=str), digest_size=8).hexdigest()
+
+
+def jittered_seconds(base: int, seed: str) -> int:
+    """Return base seconds jittered by ±10 %.
+
+    The jitter is derived from the seed (e.g. entry id), so it spreads polls of
+    different entries while staying the same across restarts.
+    """
+    return int(base * (0.9 + 0.2 * Random(seed).random()))
+
+
+def mark_subject_key(item: dict[str, Any]) -> str:
+    """Return the subject key of a mark item.
+
+    Priority: subject_id (or subject), subject_abbr, subject_name, "unknown".
+    The key is interned, so all marks of a subject share one string object and
+    dict lookups by it mostly resolve on identity.
+    """
+    sid = str(item.get("subject_id") or item.get("subject") or "").strip()
+    return sys.intern(
+        sid
+        or (item.get("subject_abbr") or "").strip()
+        or (item.get("subject_name") or "").strip()
+        or "unknown"
+    )
+
+
 def make_child_key(server: str, user_id: str) -> str:
     """Create a file-system safe and readable composite key for a child.
 
@@ -1,13 +1,19 @@
 """Test for coordinator."""
 
 import asyncio
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import json
+from types import SimpleNamespace
 from typing import Any
 
 from homeassistant.helpers import frame as ha_frame
 import pytest
 
+from custom_components.bakalari import (
+    async_remove_entry,
+    coordinator_noticeboard,
+    coordinator_timetable,
+)
 from custom_components.bakalari.children import ChildrenIndex
 from custom_components.bakalari.const import (
     CONF_CHILDREN,
@@ -16,6 +22,20 @@ from custom_components.bakalari.const import (
     CONF_USER_ID,
 )
 from custom_components.bakalari.coordinator_marks import BakalariMarksCoordinator
+from custom_components.bakalari.coordinator_noticeboard import (
+    SEEN_SAVE_DELAY,
+    BakalariNoticeboardCoordinator,
+)
+from custom_components.bakalari.coordinator_timetable import (
+    WEEK_CACHE_MAX_AGE_DAYS,
+    WEEK_CACHE_TTL,
+    BakalariTimetableCoordinator,
+)
+from custom_components.bakalari.sensor_helpers import (
+    aggregate_marks_for_child,
+    derive_all_subjects,
+    seed_created_subjects_from_data,
+)
 
 # Coordinator will be imported within tests after patching frame/report_usage
 
@@ -68,6 +88,32 @@ class FakeConfigEntry:
         self.domain = "bakalari"
 
 
+class FakeStore:
+    """In-memory stand-in for homeassistant.helpers.storage.Store."""
+
+    DATA: dict[str, Any] = {}
+
+    def __init__(self, hass, version: int, key: str) -> None:  # noqa: ANN001
+        """Initialize a fake store."""
+        self.key = key
+        self.loads = 0
+        self.delays: list[float] = []
+
+    async def async_load(self) -> Any:
+        """Return the stored data."""
+        self.loads += 1
+        return self.DATA.get(self.key)
+
+    def async_delay_save(self, data_func, delay: float = 0) -> None:  # noqa: ANN001
+        """Save the data right away and record the requested delay."""
+        self.delays.append(delay)
+        self.DATA[self.key] = data_func()
+
+    async def async_remove(self) -> None:
+        """Remove the stored data."""
+        self.DATA.pop(self.key, None)
+
+
 class FakeBakalariClient:
     """Fake BakalariClient injected into coordinator for deterministic tests."""
 
@@ -78,6 +124,7 @@ class FakeBakalariClient:
         "marks_flat": [],
     }
     MESSAGES: list[FakeMessage] = []
+    NOTICEBOARD: list[FakeMessage] = []
     TIMETABLE_WEEK: dict[str, Any] = {"week": "stub"}
 
     def __init__(self, hass, entry, child_opt_key) -> None:  # noqa: ANN001
@@ -109,12 +156,35 @@ class FakeBakalariClient:
         """Return preconfigured messages without touching arguments."""
         return list(self.MESSAGES)
 
+    async def async_fetch_noticeboard(self) -> list[FakeMessage]:
+        """Return preconfigured noticeboard messages."""
+        return list(self.NOTICEBOARD)
+
     async def async_get_timetable_actual(self, for_date):  # noqa: ANN001
         """Initialize a fake BakalariClient."""
         # Return a structure that can be serialized/logged by coordinator
         return {"week": str(for_date)}
 
 
+class FakeTimetableClient:
+    """Fake client recording the timetable weeks it was asked for."""
+
+    def __init__(self) -> None:
+        """Initialize a fake timetable client."""
+        self.calls: list[date] = []
+        # Dates for which the client returns an empty week (its error default)
+        self.empty: set[date] = set()
+
+    async def async_get_timetable_actual(self, for_date: date) -> SimpleNamespace:
+        """Return a week with one day, or an empty week."""
+        self.calls.append(for_date)
+        return SimpleNamespace(days=[] if for_date in self.empty else [for_date])
+
+    async def async_get_timetable_permanent(self) -> SimpleNamespace:
+        """Return the permanent timetable."""
+        return SimpleNamespace(days=[])
+
+
 def _make_child_options(server: str, user_id: str, **extra: Any) -> dict[str, Any]:
     """Create a minimal valid child record for options[CONF_CHILDREN]."""
     base = {
@@ -225,6 +295,8 @@ async def test_coordinator_builds_snapshot_and_emits_events(
     ck = coord.child_list[0].key
     assert data["subjects_by_child"][ck]["S1"]["name"] == "Matematika"
     assert len(data["marks_flat_by_child"][ck]) == 2
+    assert data["marks_by_child_subject"][ck]["S1"] == data["marks_flat_by_child"][ck]
+    assert data["new_count_by_child"][ck] == 2
 
     # Messages and Timetable are handled by separate coordinators now; marks coordinator exposes only marks.
 
@@ -309,6 +381,113 @@ async def test_coordinator_event_diff_only_new(monkeypatch: pytest.MonkeyPatch):
     assert len(data2["marks_flat_by_child"][ck]) == 1
 
 
+@pytest.mark.asyncio
+async def test_coordinator_event_for_replaced_older_mark(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that a replaced older mark fires an event with unchanged count and head."""
+    loop = asyncio.get_event_loop()
+    hass = FakeHass(loop)
+
+    ha_frame._hass.hass = hass  # pyright: ignore[]
+    entry = FakeConfigEntry(
+        entry_id="entry-7",
+        options={
+            CONF_CHILDREN: {"cV": _make_child_options("srvV", "uidV")},
+            CONF_SCAN_INTERVAL: 900,
+        },
+    )
+
+    def _mark(mark_id: str) -> dict[str, Any]:
+        return {"id": mark_id, "subject_id": "S1", "mark_text": "1"}
+
+    FakeBakalariClient.SNAPSHOT = {
+        "subjects": {},
+        "marks_grouped": {},
+        "marks_flat": [_mark("m3"), _mark("m2"), _mark("m1")],
+    }
+    FakeBakalariClient.MESSAGES = []
+
+    monkeypatch.setattr(ha_frame, "report_usage", lambda *a, **k: None)
+
+    children = ChildrenIndex.from_entry(entry)
+    clients = {
+        ch.key: FakeBakalariClient(hass, entry, children.option_key_for_child(ch.key))
+        for ch in children.children
+    }
+    coord = BakalariMarksCoordinator(hass, entry, children, clients)  # pyright: ignore[]
+    ck = coord.child_list[0].key
+
+    await coord._async_update_data()
+    assert len(hass.bus.events) == 3
+
+    # Same length and newest id, but m1 was replaced by a back-dated m0
+    FakeBakalariClient.SNAPSHOT = {
+        "subjects": {},
+        "marks_grouped": {},
+        "marks_flat": [_mark("m3"), _mark("m2"), _mark("m0")],
+    }
+    data = await coord._async_update_data()
+    assert data["new_count_by_child"][ck] == 1
+    assert len(hass.bus.events) == 4
+    assert hass.bus.events[-1][1]["id"] == "m0"
+
+    # The replacement is remembered as seen on the next poll
+    data = await coord._async_update_data()
+    assert data["new_count_by_child"][ck] == 0
+    assert len(hass.bus.events) == 4
+
+
+@pytest.mark.asyncio
+async def test_coordinator_forgets_removed_marks(monkeypatch: pytest.MonkeyPatch):
+    """Test that seen ids follow the snapshot when marks disappear."""
+    loop = asyncio.get_event_loop()
+    hass = FakeHass(loop)
+
+    ha_frame._hass.hass = hass  # pyright: ignore[]
+    entry = FakeConfigEntry(
+        entry_id="entry-8",
+        options={
+            CONF_CHILDREN: {"cR": _make_child_options("srvR", "uidR")},
+            CONF_SCAN_INTERVAL: 900,
+        },
+    )
+
+    def _mark(mark_id: str) -> dict[str, Any]:
+        return {"id": mark_id, "subject_id": "S1", "mark_text": "1"}
+
+    FakeBakalariClient.SNAPSHOT = {
+        "subjects": {},
+        "marks_grouped": {},
+        "marks_flat": [_mark("m3"), _mark("m2"), _mark("m1")],
+    }
+    FakeBakalariClient.MESSAGES = []
+
+    monkeypatch.setattr(ha_frame, "report_usage", lambda *a, **k: None)
+
+    children = ChildrenIndex.from_entry(entry)
+    clients = {
+        ch.key: FakeBakalariClient(hass, entry, children.option_key_for_child(ch.key))
+        for ch in children.children
+    }
+    coord = BakalariMarksCoordinator(hass, entry, children, clients)  # pyright: ignore[]
+    ck = coord.child_list[0].key
+
+    await coord._async_update_data()
+    assert coord._seen[ck] == {"m1", "m2", "m3"}
+
+    # m1 was removed and nothing new arrived
+    FakeBakalariClient.SNAPSHOT = {
+        "subjects": {},
+        "marks_grouped": {},
+        "marks_flat": [_mark("m3"), _mark("m2")],
+    }
+    data = await coord._async_update_data()
+    assert data["new_count_by_child"][ck] == 0
+    assert coord._seen[ck] == {"m2", "m3"}
+    assert len(hass.bus.events) == 3
+
+
 @pytest.mark.asyncio
 async def test_coordinator_child_mapping_and_keys(monkeypatch: pytest.MonkeyPatch):
     """Test that coordinator maps child keys to option keys correctly."""
@@ -344,3 +523,250 @@ async def test_coordinator_child_mapping_and_keys(monkeypatch: pytest.MonkeyPatc
     keys = {c.key for c in coord.child_list}
     assert "servA|userA" in keys
     assert "servB|userB" in keys
+
+
+@pytest.mark.asyncio
+async def test_coordinator_steady_state_snapshot_is_equal(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that unchanged marks produce equal data so listeners are skipped."""
+    loop = asyncio.get_event_loop()
+    hass = FakeHass(loop)
+
+    ha_frame._hass.hass = hass  # pyright: ignore[]
+    entry = FakeConfigEntry(
+        entry_id="entry-4",
+        options={
+            CONF_CHILDREN: {"cY": _make_child_options("srvY", "uidY")},
+            CONF_SCAN_INTERVAL: 900,
+        },
+    )
+
+    item = {
+        "id": "m7",
+        "date": datetime.now().isoformat(),
+        "subject_id": "S3",
+        "subject_abbr": "CJ",
+        "subject_name": "Čeština",
+        "mark_text": "2",
+        "is_new": True,
+    }
+    FakeBakalariClient.SNAPSHOT = {
+        "subjects": {"S3": {"id": "S3", "abbr": "CJ", "name": "Čeština"}},
+        "marks_grouped": {"S3": [item]},
+        "marks_flat": [item],
+    }
+    FakeBakalariClient.MESSAGES = []
+
+    monkeypatch.setattr(ha_frame, "report_usage", lambda *a, **k: None)
+
+    children = ChildrenIndex.from_entry(entry)
+    clients = {
+        ch.key: FakeBakalariClient(hass, entry, children.option_key_for_child(ch.key))
+        for ch in children.children
+    }
+    coord = BakalariMarksCoordinator(hass, entry, children, clients)  # pyright: ignore[]
+    assert coord.always_update is False
+
+    # First poll flags the mark as new, the following polls are steady state
+    await coord._async_update_data()
+    data2 = await coord._async_update_data()
+    data3 = await coord._async_update_data()
+
+    assert data2 == data3
+
+
+@pytest.mark.asyncio
+async def test_derive_all_subjects_cached_per_data(monkeypatch: pytest.MonkeyPatch):
+    """Test that subjects are derived once per coordinator data object."""
+    loop = asyncio.get_event_loop()
+    hass = FakeHass(loop)
+
+    ha_frame._hass.hass = hass  # pyright: ignore[]
+    entry = FakeConfigEntry(
+        entry_id="entry-5",
+        options={CONF_CHILDREN: {"cZ": _make_child_options("srvZ", "uidZ")}},
+    )
+    monkeypatch.setattr(ha_frame, "report_usage", lambda *a, **k: None)
+
+    children = ChildrenIndex.from_entry(entry)
+    coord = BakalariMarksCoordinator(hass, entry, children, {})  # pyright: ignore[]
+    ck = coord.child_list[0].key
+    data = {"subjects_by_child": {ck: {"S1": {"id": "S1", "abbr": "M", "name": "Ma"}}}}
+
+    first = derive_all_subjects(coord, data)
+    assert first == {ck: [("S1", "M")]}
+    assert derive_all_subjects(coord, data) is first
+
+    # New data object -> derived again
+    data2 = {"subjects_by_child": {ck: {"S2": {"id": "S2", "abbr": "F", "name": "Fy"}}}}
+    assert derive_all_subjects(coord, data2) == {ck: [("S2", "F")]}
+    assert seed_created_subjects_from_data(coord, data2) == {ck: {"S2"}}
+
+
+@pytest.mark.asyncio
+async def test_aggregate_marks_cached_per_items(monkeypatch: pytest.MonkeyPatch):
+    """Test that marks aggregation is shared while the marks list is unchanged."""
+    loop = asyncio.get_event_loop()
+    hass = FakeHass(loop)
+
+    ha_frame._hass.hass = hass  # pyright: ignore[]
+    entry = FakeConfigEntry(
+        entry_id="entry-6",
+        options={CONF_CHILDREN: {"cW": _make_child_options("srvW", "uidW")}},
+    )
+    monkeypatch.setattr(ha_frame, "report_usage", lambda *a, **k: None)
+
+    children = ChildrenIndex.from_entry(entry)
+    coord = BakalariMarksCoordinator(hass, entry, children, {})  # pyright: ignore[]
+    ck = coord.child_list[0].key
+    items = [
+        {"id": "1", "subject_id": "S1", "subject_abbr": "M", "mark_text": "1"},
+        {"id": "2", "subject_id": "S1", "subject_abbr": "M", "mark_text": "3"},
+    ]
+    coord.data = {"marks_by_child": {ck: items}}
+
+    agg = aggregate_marks_for_child(coord, ck)
+    assert agg["overall"]["total"] == 2
+    assert agg["overall"]["average"] == 2.0
+    assert aggregate_marks_for_child(coord, ck) is agg
+
+    # A new marks list (next refresh) is aggregated again
+    coord.data = {"marks_by_child": {ck: items[:1]}}
+    assert aggregate_marks_for_child(coord, ck)["overall"]["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_noticeboard_seen_ids_persisted(monkeypatch: pytest.MonkeyPatch):
+    """Test that seen noticeboard ids are loaded once, saved and bounded."""
+    loop = asyncio.get_event_loop()
+    hass = FakeHass(loop)
+
+    ha_frame._hass.hass = hass  # pyright: ignore[]
+    entry = FakeConfigEntry(
+        entry_id="entry-nb",
+        options={CONF_CHILDREN: {"cN": _make_child_options("srvN", "uidN")}},
+    )
+    monkeypatch.setattr(ha_frame, "report_usage", lambda *a, **k: None)
+    monkeypatch.setattr(coordinator_noticeboard, "Store", FakeStore)
+
+    children = ChildrenIndex.from_entry(entry)
+    ck = children.children[0].key
+    store_key = "bakalari.noticeboard_seen.entry-nb"
+    # "a" was seen before the restart
+    monkeypatch.setattr(FakeStore, "DATA", {store_key: {ck: ["a"]}})
+    clients = {
+        ch.key: FakeBakalariClient(hass, entry, children.option_key_for_child(ch.key))
+        for ch in children.children
+    }
+    coord = BakalariNoticeboardCoordinator(hass, entry, children, clients)  # pyright: ignore[]
+    store: FakeStore = coord._seen_store  # pyright: ignore[]
+
+    FakeBakalariClient.NOTICEBOARD = [
+        FakeMessage({"id": "a"}),
+        FakeMessage({"id": "b"}),
+    ]
+    data = await coord._async_update_data()
+    assert [m["is_new"] for m in data["messages_by_child"][ck]] == [False, True]
+    assert hass.bus.events[0] == (
+        "bakalari_new_noticeboard_messages",
+        {"child_key": ck, "messages": [data["messages_by_child"][ck][1]]},
+    )
+    assert store.delays == [SEEN_SAVE_DELAY]
+    assert FakeStore.DATA[store_key] == {ck: ["a", "b"]}
+
+    # Ids that left the board are forgotten
+    FakeBakalariClient.NOTICEBOARD = [
+        FakeMessage({"id": "b"}),
+        FakeMessage({"id": "c"}),
+    ]
+    await coord._async_update_data()
+    assert FakeStore.DATA[store_key] == {ck: ["b", "c"]}
+
+    # An empty fetch (client error) keeps the ids and saves nothing
+    FakeBakalariClient.NOTICEBOARD = []
+    await coord._async_update_data()
+    assert FakeStore.DATA[store_key] == {ck: ["b", "c"]}
+    assert len(store.delays) == 2
+    assert store.loads == 1
+
+    FakeBakalariClient.NOTICEBOARD = [FakeMessage({"id": "c"})]
+    data = await coord._async_update_data()
+    assert data["messages_by_child"][ck][0]["is_new"] is False
+
+    # Removing the entry drops the stored ids
+    await async_remove_entry(hass, entry)  # pyright: ignore[]
+    assert store_key not in FakeStore.DATA
+
+
+@pytest.mark.asyncio
+async def test_timetable_week_cache(monkeypatch: pytest.MonkeyPatch):
+    """Test reuse, refetch, expiry and eviction of cached timetable weeks."""
+    loop = asyncio.get_event_loop()
+    hass = FakeHass(loop)
+
+    ha_frame._hass.hass = hass  # pyright: ignore[]
+    entry = FakeConfigEntry(
+        entry_id="entry-tt",
+        options={CONF_CHILDREN: {"cT": _make_child_options("srvT", "uidT")}},
+    )
+    monkeypatch.setattr(ha_frame, "report_usage", lambda *a, **k: None)
+
+    # Wednesday; the window is this, next and previous week
+    today = [datetime(2025, 3, 12, 8, 0)]
+    clock = [1000.0]
+    monkeypatch.setattr(
+        coordinator_timetable, "ha_dt", SimpleNamespace(now=lambda: today[0])
+    )
+    monkeypatch.setattr(coordinator_timetable, "monotonic", lambda: clock[0])
+
+    children = ChildrenIndex.from_entry(entry)
+    client = FakeTimetableClient()
+    clients = {ch.key: client for ch in children.children}
+    coord = BakalariTimetableCoordinator(hass, entry, children, clients)  # pyright: ignore[]
+    current, nxt, prev = date(2025, 3, 12), date(2025, 3, 19), date(2025, 3, 5)
+
+    await coord._async_update_data()
+    assert client.calls == [current, nxt, prev]
+
+    # Other weeks come from the cache, the current week is always refetched
+    client.calls.clear()
+    data = await coord._async_update_data()
+    assert client.calls == [current]
+    ck = children.children[0].key
+    assert [w.days for w in data["timetable_by_child"][ck]] == [
+        [current],
+        [nxt],
+        [prev],
+    ]
+
+    # Cached weeks expire after the TTL
+    client.calls.clear()
+    clock[0] += WEEK_CACHE_TTL
+    await coord._async_update_data()
+    assert client.calls == [current, nxt, prev]
+
+    # Empty weeks (client errors) are not cached
+    client.calls.clear()
+    client.empty = {date(2025, 3, 26)}
+    today[0] = datetime(2025, 3, 19, 8, 0)
+    await coord._async_update_data()
+    await coord._async_update_data()
+    assert client.calls.count(date(2025, 3, 26)) == 2
+    assert client.calls.count(date(2025, 3, 12)) == 0
+
+    # Weeks starting more than the max age before this week are evicted
+    assert {week for _, week in coord._week_cache} == {
+        date(2025, 3, 3),
+        date(2025, 3, 10),
+        date(2025, 3, 17),
+    }
+    today[0] = datetime(2025, 4, 9, 8, 0)
+    await coord._async_update_data()
+    oldest = date(2025, 4, 7) - timedelta(days=WEEK_CACHE_MAX_AGE_DAYS)
+    assert oldest == date(2025, 3, 24)
+    assert {week for _, week in coord._week_cache} == {
+        date(2025, 3, 31),
+        date(2025, 4, 7),
+        date(2025, 4, 14),
+    }
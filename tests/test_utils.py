@@ -0,0 +1,91 @@
+"""Test utils."""
+
+from datetime import datetime
+
+from async_bakalari_api.komens import MessageContainer
+import orjson
+
+from custom_components.bakalari.utils import (
+    composed_message_id,
+    extract_message_id,
+    jittered_seconds,
+    mark_subject_key,
+    message_to_dict,
+    messages_to_dicts,
+)
+
+
+def test_message_to_dict_matches_json_round_trip():
+    """Test that message_to_dict matches the parsed as_json() output."""
+    msg = MessageContainer(
+        mid="M1",
+        title="Třídní schůzky",
+        text="<p>Obsah</p>",
+        sent=datetime(2025, 9, 15, 8, 30),
+        sender={"Id": "T1", "Name": "Učitel"},
+        read=False,
+        attachments=[{"Id": "A1", "Name": "pozvanka.pdf"}],
+    )
+
+    result = message_to_dict(msg)
+    assert result == orjson.loads(msg.as_json())
+    # The dict must not alias library state
+    assert result["sender"] is not msg.sender
+
+
+def test_messages_to_dicts_falls_back_to_json():
+    """Test that non-Komens messages are parsed from their as_json() output."""
+
+    class _JsonMessage:
+        def __init__(self, payload: dict) -> None:
+            self._payload = payload
+
+        def as_json(self) -> bytes:
+            return orjson.dumps(self._payload)
+
+    items = [_JsonMessage({"id": "a"}), _JsonMessage({"id": "b"})]
+
+    assert messages_to_dicts(items) == [{"id": "a"}, {"id": "b"}]
+    assert messages_to_dicts(None) == []
+
+
+def test_jittered_seconds_is_stable_per_seed():
+    """Test that jitter stays within ±10 % and is reproducible for a seed."""
+    first = jittered_seconds(900, "entry-1:marks")
+
+    assert 810 <= first <= 990
+    assert jittered_seconds(900, "entry-1:marks") == first
+
+
+def test_mark_subject_key_priority():
+    """Test that the subject key prefers id, then abbreviation, then name."""
+    assert mark_subject_key({"subject_id": " S1 ", "subject_abbr": "M"}) == "S1"
+    assert mark_subject_key({"subject_abbr": "M ", "subject_name": "Ma"}) == "M"
+    assert mark_subject_key({"subject_name": "Ma"}) == "Ma"
+    assert mark_subject_key({}) == "unknown"
+
+
+def test_mark_subject_key_interned():
+    """Test that equal subject keys share one string object."""
+    a = mark_subject_key({"subject_id": "Subj1 "})
+    b = mark_subject_key({"subject_id": " Subj1"})
+    assert a is b
+
+
+def test_extract_message_id_prefers_hint():
+    """Test that the id is read from the hinted key first, then by priority."""
+    msg = {"id": "7", "mid": " ", "MessageId": "M7"}
+    assert extract_message_id(msg) == ("7", "id")
+    assert extract_message_id(msg, "MessageId") == ("M7", "MessageId")
+    assert extract_message_id(msg, "uuid") == ("7", "id")
+    assert extract_message_id({"subject": "Ahoj"}) is None
+
+
+def test_composed_message_id_is_stable():
+    """Test that the fallback id depends only on the typical message fields."""
+    msg = {"subject": "Ahoj", "date": "2025-09-01", "text": "a"}
+    mid = composed_message_id(msg)
+    assert mid is not None
+    assert composed_message_id({**msg, "text": "b"}) == mid
+    assert composed_message_id({**msg, "subject": "Nazdar"}) != mid
+    assert composed_message_id({"text": "a"}) is None